@@ -1,9 +1,18 @@
+import json
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
+from scoring import (
+    CONSISTENCY_TARGET,
+    TAKEOFF_THRESHOLDS,
+    load_optional,
+    read_manifest,
+    read_processed,
+)
 
 # Page config
 st.set_page_config(
@@ -19,198 +28,15 @@ st.markdown(
     "broad-based gains or concentrated displacement**"
 )
 
-# --- Takeoff criteria ---
-# Each defines a 3-year threshold that would be historically abnormal.
-# Organized into three categories: Smoking Guns, Displacement Effects, Investment Causes.
-TAKEOFF_THRESHOLDS = {
-    # STRUCTURAL SHIFTS — hardest to explain without AI
-    "tfp": {
-        "label": "TFP Acceleration",
-        "threshold": 6.0,
-        "early_threshold": 2.0,
-        "unit": "%",
-        "direction": "rise",
-        "weight": 0.14,
-        "frequency": "annual",
-        "rationale": (
-            "TFP grows ~1%/yr historically. 2%/yr sustained (6% over 3 years) "
-            "means more output from the same inputs — the productivity signature of AI."
-        ),
-    },
-    "occupation_gap": {
-        "label": "AI Job Displacement Gap",
-        "threshold": 15.0,
-        "early_threshold": 5.0,
-        "unit": "pp",
-        "direction": "rise",
-        "weight": 0.13,
-        "frequency": "quarterly",
-        "rationale": (
-            "If AI-targetable occupations (office, legal, sales, tech) decline "
-            "while non-automatable (construction, healthcare) grow, a 15pp gap "
-            "over 3 years would be structural, not cyclical."
-        ),
-    },
-    "capital_labor": {
-        "label": "Capital-Labor Substitution",
-        "threshold": 12.0,
-        "early_threshold": 4.0,
-        "unit": "%",
-        "direction": "rise",
-        "weight": 0.10,
-        "frequency": "annual",
-        "rationale": (
-            "The capital-to-labor ratio rises ~1-2%/yr normally. "
-            "4%/yr (12% over 3 years) means firms are actively "
-            "replacing workers with capital (AI/software)."
-        ),
-    },
-    # WAGE & DISTRIBUTION — who benefits from AI gains
-    "median_wages": {
-        "label": "Real Median Wage Decline",
-        "threshold": 5.0,
-        "early_threshold": 1.5,
-        "unit": "%",
-        "direction": "decline",
-        "weight": 0.09,
-        "frequency": "quarterly",
-        "rationale": (
-            "Real median weekly earnings grow ~0.5-1%/yr historically. "
-            "A 5% decline over 3 years during productivity growth would be "
-            "THE displacement outcome — the economy growing while workers "
-            "get poorer. The single most important metric for whether AI "
-            "is helping or hurting people."
-        ),
-    },
-    "info_jobs_per_grad": {
-        "label": "Knowledge Jobs per Graduate Decline",
-        "threshold": 20.0,
-        "early_threshold": 8.0,
-        "unit": "%",
-        "direction": "decline",
-        "weight": 0.07,
-        "frequency": "quarterly",
-        "rationale": (
-            "Information sector employment divided by college-educated "
-            "labor force. Directly measures whether the knowledge economy "
-            "is creating or destroying demand for graduates. Unlike wages "
-            "(which reflect survivors), this catches structural erosion: "
-            "fewer knowledge jobs chasing more graduates. A 20% decline "
-            "over 3 years would signal the knowledge economy is contracting "
-            "relative to the educated workforce — the demand-side "
-            "displacement signal that wage data misses entirely."
-        ),
-    },
-    "labor_share": {
-        "label": "Labor Share Decline",
-        "threshold": 5.0,
-        "early_threshold": 1.7,
-        "unit": "pp",
-        "direction": "decline",
-        "weight": 0.06,
-        "frequency": "quarterly",
-        "rationale": (
-            "Labor share declined ~5pp over 15 years (2000-2015). "
-            "5pp in 3 years = 5x the historical rate."
-        ),
-    },
-    # LABOUR MARKET HEALTH — the human cost metrics
-    "prime_age_epop": {
-        "label": "Prime-Age EPOP Decline",
-        "threshold": 3.0,
-        "early_threshold": 1.0,
-        "unit": "pp",
-        "direction": "decline",
-        "weight": 0.08,
-        "frequency": "quarterly",
-        "rationale": (
-            "Prime-age (25-54) employment-population ratio is ~80% "
-            "when healthy. A 3pp decline during GDP growth is the "
-            "signature of structural displacement — the economy "
-            "thriving while workers suffer. Cannot be gamed by "
-            "discouraged workers leaving the labour force."
-        ),
-    },
-    "quits_rate": {
-        "label": "Quits Rate Decline",
-        "threshold": 0.8,
-        "early_threshold": 0.3,
-        "unit": "pp",
-        "direction": "decline",
-        "weight": 0.07,
-        "frequency": "quarterly",
-        "rationale": (
-            "Workers quit when they're confident they can find "
-            "something better. A 0.8pp decline (from ~2.2% to ~1.4%) "
-            "in a growing economy means workers feel trapped — the "
-            "earliest sentiment indicator of labour market distress."
-        ),
-    },
-    "unemployment": {
-        "label": "College Unemployment Rise",
-        "threshold": 2.0,
-        "early_threshold": 0.7,
-        "unit": "pp",
-        "direction": "rise",
-        "weight": 0.07,
-        "frequency": "quarterly",
-        "rationale": (
-            "College-educated unemployment is typically 2-3%. "
-            "A 2pp rise (to 4-5%) would be structurally abnormal."
-        ),
-    },
-    # AI INVESTMENT SCALE — the cause indicators
-    "nvidia": {
-        "label": "NVIDIA Quarterly Revenue",
-        "threshold": 200000.0,  # $200B/quarter ($800B/yr)
-        "early_threshold": 67000.0,  # ~$67B/quarter
-        "unit": "$M",
-        "direction": "rise",
-        "weight": 0.08,
-        "frequency": "quarterly",
-        "metric_type": "level",  # Absolute level, not growth rate
-        "rationale": (
-            "$200B/quarter = ~$800B/yr from one AI chip company. "
-            "At that scale, AI compute spending is ~3-4% of US GDP. "
-            "Note: revenue measures compute spending, not deployment type — "
-            "the same hardware could power automation or augmentation."
-        ),
-    },
-    "it_equipment": {
-        "label": "IT Equipment Investment Growth",
-        "threshold": 30.0,
-        "early_threshold": 10.0,
-        "unit": "%",
-        "direction": "rise",
-        "weight": 0.06,
-        "frequency": "quarterly",
-        "rationale": (
-            "Real private investment in information processing equipment "
-            "grows ~3-5%/yr historically. 10%/yr sustained (30% over 3 years) "
-            "signals a structural shift toward capital-over-labor. Broader "
-            "than NVIDIA alone (captures all vendors). The hardware side "
-            "of AI capex."
-        ),
-    },
-    "software_investment": {
-        "label": "Software Investment Growth",
-        "threshold": 40.0,
-        "early_threshold": 15.0,
-        "unit": "%",
-        "direction": "rise",
-        "weight": 0.05,
-        "frequency": "quarterly",
-        "rationale": (
-            "Real private investment in software grows ~5-7%/yr historically. "
-            "~12%/yr sustained (40% over 3 years) signals massive capital "
-            "reallocation toward AI/software systems. Captures cloud AI, "
-            "enterprise platforms, SaaS tools — the software side of AI "
-            "capex that hardware metrics miss."
-        ),
-    },
-}
+# Line charts beyond this many points are thinned before being sent to the browser.
+MAX_CHART_POINTS = 500
+
+# Shared chart styling, built once instead of per figure on every rerun
+BASE_LAYOUT = dict(plot_bgcolor="white", paper_bgcolor="white", font=dict(size=12))
+LINE_WIDTH = 3
+# Average month length; regular series are sent as a start date plus this step
+MS_PER_MONTH = 365.2425 / 12 * 86_400_000
 
-CONSISTENCY_TARGET = 0.75
 METRIC_CATEGORIES = {
     "Structural Shifts": ["tfp", "occupation_gap", "capital_labor"],
     "Wage & Distribution": ["median_wages", "info_jobs_per_grad", "labor_share"],
@@ -226,57 +52,51 @@ CATEGORY_ICONS = {
 }
 
 
-def load_optional(data_dir: Path, subdir: str, filename: str):
-    """Load a CSV if it exists, add date column, return df or None."""
-    path = data_dir / subdir / filename
-    if not path.exists():
-        return None
-    df = pd.read_csv(path)
-    df["date"] = pd.to_datetime(df[["year", "month"]].assign(day=1))
-    return df
-
-
 @st.cache_data(ttl=3600)
 def load_data():
     """Load all processed datasets."""
     d = Path("data/processed")
+    manifest = read_manifest(d)
 
-    labor = pd.read_csv(d / "labor_share" / "labor_share_processed.csv")
-    labor["date"] = pd.to_datetime(labor[["year", "month"]].assign(day=1))
-
-    gdp = pd.read_csv(d / "real_gdp_per_capita" / "real_gdp_per_capita_processed.csv")
-    gdp["date"] = pd.to_datetime(gdp[["year", "month"]].assign(day=1))
+    labor = read_processed(d / "labor_share" / "labor_share_processed.csv")
+    gdp = read_processed(d / "real_gdp_per_capita" / "real_gdp_per_capita_processed.csv")
 
     unemp = load_optional(
         d,
         "graduate_unemployment_rate",
         "graduate_unemployment_rate_processed.csv",
+        manifest,
     )
-    nvidia = load_optional(d, "nvidia_revenue", "nvidia_revenue_processed.csv")
-    tfp = load_optional(d, "tfp", "tfp_processed.csv")
-    cap_lab = load_optional(d, "capital_labor", "capital_labor_processed.csv")
-    occ = load_optional(d, "occupation_employment", "occupation_employment_processed.csv")
-    biz_apps = load_optional(d, "business_applications", "business_applications_processed.csv")
-    epop = load_optional(d, "prime_age_epop", "prime_age_epop_processed.csv")
-    quits = load_optional(d, "quits_rate", "quits_rate_processed.csv")
+    nvidia = load_optional(d, "nvidia_revenue", "nvidia_revenue_processed.csv", manifest)
+    tfp = load_optional(d, "tfp", "tfp_processed.csv", manifest)
+    cap_lab = load_optional(d, "capital_labor", "capital_labor_processed.csv", manifest)
+    occ = load_optional(d, "occupation_employment", "occupation_employment_processed.csv", manifest)
+    biz_apps = load_optional(
+        d, "business_applications", "business_applications_processed.csv", manifest
+    )
+    epop = load_optional(d, "prime_age_epop", "prime_age_epop_processed.csv", manifest)
+    quits = load_optional(d, "quits_rate", "quits_rate_processed.csv", manifest)
     it_equip = load_optional(
         d,
         "it_equipment_investment",
         "it_equipment_investment_processed.csv",
+        manifest,
     )
-    median_wages = load_optional(d, "median_wages", "median_wages_processed.csv")
+    median_wages = load_optional(d, "median_wages", "median_wages_processed.csv", manifest)
     info_jobs = load_optional(
         d,
         "info_jobs_per_grad",
         "info_jobs_per_grad_processed.csv",
+        manifest,
     )
     software_inv = load_optional(
         d,
         "software_investment",
         "software_investment_processed.csv",
+        manifest,
     )
 
-    return {
+    datasets = {
         "labor_share": labor,
         "gdp_per_capita": gdp,
         "unemployment": unemp,
@@ -293,135 +113,17 @@ def load_data():
         "software_investment": software_inv,
     }
 
+    return datasets
 
-def align_to_quarterly(df):
-    """Convert monthly data to quarterly (last month of each quarter)."""
-    df_copy = df.copy()
-    q = df_copy[df_copy["date"].dt.month.isin([3, 6, 9, 12])].copy()
-    return q.sort_values("date").reset_index(drop=True)
-
-
-def compute_3yr_change(df, col, use_absolute=False, frequency="quarterly"):
-    """Compute 3-year change. Handles quarterly (12 periods) and annual (3 periods)."""
-    df_sorted = df.sort_values("date").reset_index(drop=True)
-    lookback = 3 if frequency == "annual" else 12
-
-    if len(df_sorted) <= lookback:
-        return None
-
-    current = df_sorted[col].iloc[-1]
-    past = df_sorted[col].iloc[-(lookback + 1)]
-
-    if use_absolute:
-        return current - past
-    if past == 0:
-        return None
-    return ((current - past) / past) * 100
-
-
-def compute_consistency(df, col, direction="rise"):
-    """Fraction of period-over-period changes in the expected direction."""
-    df_sorted = df.sort_values("date").reset_index(drop=True)
-    if len(df_sorted) < 2:
-        return None
-
-    changes = df_sorted[col].diff().dropna()
-    if len(changes) == 0:
-        return None
-
-    if direction == "decline":
-        correct = (changes < 0).sum()
-    else:
-        correct = (changes > 0).sum()
-    return correct / len(changes)
-
-
-def compute_takeoff_metrics(datasets):
-    """Compute progress toward takeoff for each metric."""
-    results = {}
-
-    # Map threshold keys to (dataframe, column, use_absolute)
-    metric_configs = {
-        "tfp": ("tfp", "tfp_index", False),
-        "occupation_gap": ("occupation_q", "displacement_gap", True),
-        "capital_labor": ("capital_labor", "capital_labor_ratio", False),
-        "median_wages": ("median_wages", "median_weekly_earnings", False),
-        "info_jobs_per_grad": ("info_jobs_per_grad_q", "info_jobs_per_grad", False),
-        "labor_share": ("labor_share", "labor_share_index", True),
-        "prime_age_epop": ("prime_age_epop_q", "prime_age_epop", True),
-        "quits_rate": ("quits_rate_q", "quits_rate", True),
-        "unemployment": ("unemployment_q", "graduate_unemployment_rate", True),
-        "nvidia": ("nvidia", "revenue_millions", False),
-        "it_equipment": ("it_equipment", "it_equipment_investment", False),
-        "software_investment": ("software_investment", "software_investment", False),
-    }
-
-    for key, (ds_key, col, use_abs) in metric_configs.items():
-        df = datasets.get(ds_key)
-        if df is None or len(df) == 0:
-            continue
-        if key not in TAKEOFF_THRESHOLDS:
-            continue
-
-        info = TAKEOFF_THRESHOLDS[key]
-        freq = info["frequency"]
-        metric_type = info.get("metric_type", "change")
 
-        cons = compute_consistency(df, col, direction=info["direction"])
-        if cons is None:
-            continue
-
-        if metric_type == "level":
-            # Absolute level: progress = current value / threshold
-            df_sorted = df.sort_values("date").reset_index(drop=True)
-            current_val = df_sorted[col].iloc[-1]
-            progress = max(0.0, current_val / info["threshold"])
-            raw_change = current_val
-            effective = current_val
-        else:
-            # Change-based: progress = 3yr change / threshold
-            raw = compute_3yr_change(df, col, use_absolute=use_abs, frequency=freq)
-            if raw is None:
-                continue
-            effective = -raw if info["direction"] == "decline" else raw
-            progress = max(0.0, effective / info["threshold"])
-            raw_change = raw
-
-        score = progress * cons
-
-        results[key] = {
-            "progress": progress,
-            "consistency": cons,
-            "score": score,
-            "raw_change": raw_change,
-            "effective_change": effective,
-            "threshold": info["threshold"],
-        }
-
-    return results
-
-
-def compute_takeoff_score(metrics):
-    """Compute overall takeoff score (0-100)."""
-    if not metrics:
-        return 0.0
-
-    total_w = 0.0
-    weighted_sum = 0.0
-    for key, data in metrics.items():
-        w = TAKEOFF_THRESHOLDS[key]["weight"]
-        weighted_sum += w * min(1.0, data["score"])
-        total_w += w
-
-    if total_w == 0:
-        return 0.0
-
-    base = weighted_sum / total_w
-    active = sum(1 for d in metrics.values() if d["score"] > 0.3)
-    coherence = 0.5 + 0.5 * (active / len(TAKEOFF_THRESHOLDS))
-    return min(100.0, base * coherence * 100)
+@st.cache_data(ttl=3600)
+def load_takeoff_scores():
+    """Load the takeoff metrics and overall score precomputed by the pipeline."""
+    payload = json.loads(Path("data/processed/takeoff_scores.json").read_text())
+    return payload["metrics"], payload["score"]
 
 
+@st.cache_data(ttl=3600)
 def compute_compensation_health(labor_share_df, gdp_df):
     """Derive compensation health from existing labor share and GDP data.
 
@@ -429,12 +131,11 @@ def compute_compensation_health(labor_share_df, gdp_df):
     Negative = gains concentrating in capital (compensation failing).
     Based on Acemoglu-Restrepo (2019) reinstatement framework.
     """
-    ls = labor_share_df.sort_values("date").reset_index(drop=True)
-    gd = gdp_df.sort_values("date").reset_index(drop=True)
-
+    # Both frames arrive date-sorted from read_processed, and the inner merge
+    # keeps that order for the lagged diffs below
     merged = pd.merge(
-        ls[["date", "labor_share_index"]],
-        gd[["date", "real_gdp_per_capita"]],
+        labor_share_df[["date", "labor_share_index"]],
+        gdp_df[["date", "real_gdp_per_capita"]],
         on="date",
     )
 
@@ -458,787 +159,852 @@ def compute_diffusion_index(metrics, threshold_level="early"):
     return active, total, active / total if total > 0 else 0
 
 
+def downsample_lttb(df, x, y, max_points=MAX_CHART_POINTS):
+    """Thin a long series with Largest-Triangle-Three-Buckets, keeping its shape.
+
+    The first and last rows are always kept; each bucket in between keeps the
+    row forming the largest triangle with the previous pick and the mean of
+    the next bucket.
+    """
+    n = len(df)
+    if n <= max_points:
+        return df
+
+    xs = df[x].to_numpy().astype("int64").astype(float)
+    ys = df[y].to_numpy().astype(float)
+    edges = np.linspace(1, n - 1, max_points - 1, dtype=int)
+    keep = np.empty(max_points, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+
+    # Every bucket's mean in one vectorized pass; the segment after the last
+    # bucket is just the final row
+    bounds = np.append(edges, n)
+    counts = np.diff(bounds)
+    mean_x = np.add.reduceat(xs, bounds[:-1]) / counts
+    mean_y = np.add.reduceat(ys, bounds[:-1]) / counts
+
+    prev = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_x, next_y = mean_x[i + 1], mean_y[i + 1]
+        area = np.abs(
+            (xs[prev] - next_x) * (ys[start:end] - ys[prev])
+            - (xs[prev] - xs[start:end]) * (next_y - ys[prev])
+        )
+        prev = start + np.argmax(np.nan_to_num(area, nan=-1.0))
+        keep[i + 1] = prev
+    return df.iloc[keep]
+
+
+def uniform_time_axis(dates):
+    """x0/dx trace args for a regular month-cadence date series, else explicit x.
+
+    Sending a start and step instead of one date string per point shrinks the
+    figure payload. Month lengths vary, so the average step lands within 3 days
+    of each true month start; x0 is nudged 3 days forward so every point stays
+    inside its own month and month-precision hover labels remain exact.
+    """
+    months = dates.to_numpy().astype("datetime64[M]").astype(int)
+    steps = np.diff(months)
+    if len(months) < 2 or steps[0] <= 0 or (steps != steps[0]).any():
+        return dict(x=dates)
+    return dict(x0=dates.iloc[0] + pd.Timedelta(days=3), dx=steps[0] * MS_PER_MONTH)
+
+
+def frame_key(df):
+    """Cheap identity for a date-sorted frame, used in place of hashing it."""
+    return (len(df), df["date"].iloc[-1] if len(df) else None)
+
+
 def make_chart(df, x, y, title, labels, color, chart_type="line"):
-    """Create a styled plotly chart."""
+    """Create a styled plotly chart, reusing the cached figure while df is unchanged."""
+    return build_chart(df, frame_key(df), x, y, title, labels, color, chart_type)
+
+
+@st.cache_resource(ttl=3600)
+def build_chart(_df, df_key, x, y, title, labels, color, chart_type):
+    """Build a styled plotly chart; _df is not hashed, df_key identifies it."""
     if chart_type == "bar":
-        fig = px.bar(df, x=x, y=y, title=title, labels=labels)
+        fig = px.bar(_df, x=x, y=y, title=title, labels=labels)
         fig.update_traces(marker_color=color)
     else:
-        fig = px.line(df, x=x, y=y, title=title, labels=labels)
-        fig.update_traces(line=dict(color=color, width=3))
-    fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        font=dict(size=12),
-        showlegend=False,
-    )
+        plot_df = downsample_lttb(_df, x, y)
+        x_label, y_label = labels.get(x, x), labels.get(y, y)
+        fig = go.Figure(
+            go.Scattergl(
+                **uniform_time_axis(plot_df[x]),
+                y=plot_df[y].to_numpy(),
+                mode="lines",
+                line=dict(color=color, width=LINE_WIDTH),
+                hovertemplate=f"{x_label}=%{{x|%b %Y}}<br>{y_label}=%{{y}}<extra></extra>",
+            )
+        )
+        fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label, margin=dict(t=60))
+        fig.update_xaxes(type="date")
+    fig.update_layout(**BASE_LAYOUT, showlegend=False)
     return fig
 
 
-# --- Dashboard rendering ---
-try:
-    data = load_data()
+@st.cache_resource(ttl=3600)
+def build_occupation_charts(_occ, occ_key):
+    """Build the displacement gap line and bar charts; occ_key identifies _occ."""
+    # Primary chart: the displacement gap (shaded area), WebGL like the
+    # other monthly series
+    fig_gap = go.Figure()
+
+    # Shaded area between the two lines
+    fig_gap.add_trace(
+        go.Scattergl(
+            x=_occ["date"],
+            y=_occ["non_automatable_index"],
+            name="Non-Automatable",
+            line=dict(color="#2ca02c", width=LINE_WIDTH),
+            mode="lines",
+        )
+    )
+    fig_gap.add_trace(
+        go.Scattergl(
+            x=_occ["date"],
+            y=_occ["ai_targetable_index"],
+            name="AI-Targetable",
+            line=dict(color="#d62728", width=LINE_WIDTH),
+            fill="tonexty",
+            fillcolor="rgba(214, 39, 40, 0.15)",
+            mode="lines",
+        )
+    )
+    # Baseline at 100
+    fig_gap.add_hline(
+        y=100,
+        line_dash="dot",
+        line_color="#999",
+        annotation_text="Baseline",
+        annotation_position="bottom left",
+    )
 
-    tab1, tab2, tab3, tab4 = st.tabs(
-        [
-            "📈 Time Series Charts",
-            "🎯 Transformation Analysis",
-            "🔮 Scenario Projections",
-            "📚 Methodology",
-        ]
+    # Annotate the current gap
+    latest = {
+        col: _occ[col].to_numpy()[-1]
+        for col in ["date", "displacement_gap", "non_automatable_index", "ai_targetable_index"]
+    }
+    gap_val = latest["displacement_gap"]
+    fig_gap.add_annotation(
+        x=latest["date"],
+        y=(latest["non_automatable_index"] + latest["ai_targetable_index"]) / 2,
+        text=f"Gap: {gap_val:+.1f}pp",
+        showarrow=True,
+        arrowhead=2,
+        ax=60,
+        ay=0,
+        font=dict(size=14, color="#d62728"),
+        bgcolor="white",
+        bordercolor="#d62728",
+        borderwidth=1,
     )
 
-    with tab1:
-        st.header("Economic Indicators Over Time")
-
-        # Organize charts by category
-        st.subheader("🔬 Structural Shift Indicators")
-
-        if data["tfp"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["tfp"],
-                    "date",
-                    "tfp_index",
-                    "Total Factor Productivity (2017=100)",
-                    {"date": "Date", "tfp_index": "TFP Index"},
-                    "#e377c2",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED MFPNFBS]"
-                "(https://fred.stlouisfed.org/series/MFPNFBS)"
-                " — Annual, BLS Multifactor Productivity"
-            )
+    fig_gap.update_layout(
+        title="AI Displacement Gap: AI-Targetable vs Non-Automatable Jobs",
+        **BASE_LAYOUT,
+        yaxis_title="Employment Index (start = 100)",
+        xaxis_title="Date",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5,
+        ),
+    )
 
-        if data["capital_labor"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["capital_labor"],
-                    "date",
-                    "capital_labor_ratio",
-                    "Capital-to-Labor Input Ratio (2017=1.0)",
-                    {"date": "Date", "capital_labor_ratio": "Ratio"},
-                    "#17becf",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED MPU4910042/MPU4910052]"
-                "(https://fred.stlouisfed.org/series/MPU4910042)"
-                " — Annual, BLS MFP Dataset"
-            )
+    # Secondary chart: the gap itself as a bar chart
+    fig_gap_bars = go.Figure()
+    colors = ["#d62728" if g > 0 else "#2ca02c" for g in _occ["displacement_gap"]]
+    fig_gap_bars.add_trace(
+        go.Bar(
+            x=_occ["date"],
+            y=_occ["displacement_gap"],
+            marker_color=colors,
+            name="Displacement Gap",
+        )
+    )
+    # Threshold line at 15pp
+    fig_gap_bars.add_hline(
+        y=15,
+        line_dash="dash",
+        line_color="red",
+        annotation_text="Takeoff threshold (15pp)",
+        annotation_position="top left",
+    )
+    fig_gap_bars.add_hline(y=0, line_color="#999", line_width=1)
 
-        if data["occupation"] is not None:
-            occ = data["occupation"]
+    fig_gap_bars.update_layout(
+        title="Displacement Gap Over Time (Non-Automatable - AI-Targetable)",
+        **BASE_LAYOUT,
+        yaxis_title="Gap (pp)",
+        xaxis_title="Date",
+        showlegend=False,
+    )
+    return fig_gap, fig_gap_bars
 
-            # Primary chart: the displacement gap (shaded area)
-            fig_gap = go.Figure()
 
-            # Shaded area between the two lines
-            fig_gap.add_trace(
-                go.Scatter(
-                    x=occ["date"],
-                    y=occ["non_automatable_index"],
-                    name="Non-Automatable",
-                    line=dict(color="#2ca02c", width=3),
-                    mode="lines",
-                )
-            )
-            fig_gap.add_trace(
-                go.Scatter(
-                    x=occ["date"],
-                    y=occ["ai_targetable_index"],
-                    name="AI-Targetable",
-                    line=dict(color="#d62728", width=3),
-                    fill="tonexty",
-                    fillcolor="rgba(214, 39, 40, 0.15)",
-                    mode="lines",
-                )
-            )
-            # Baseline at 100
-            fig_gap.add_hline(
-                y=100,
-                line_dash="dot",
-                line_color="#999",
-                annotation_text="Baseline",
-                annotation_position="bottom left",
-            )
+@st.fragment
+def render_time_series(data):
+    """Render the time series tab."""
+    st.header("Economic Indicators Over Time")
 
-            # Annotate the current gap
-            latest = occ.iloc[-1]
-            gap_val = latest["displacement_gap"]
-            fig_gap.add_annotation(
-                x=latest["date"],
-                y=(latest["non_automatable_index"] + latest["ai_targetable_index"]) / 2,
-                text=f"Gap: {gap_val:+.1f}pp",
-                showarrow=True,
-                arrowhead=2,
-                ax=60,
-                ay=0,
-                font=dict(size=14, color="#d62728"),
-                bgcolor="white",
-                bordercolor="#d62728",
-                borderwidth=1,
-            )
+    # Organize charts by category
+    st.subheader("🔬 Structural Shift Indicators")
 
-            fig_gap.update_layout(
-                title="AI Displacement Gap: AI-Targetable vs Non-Automatable Jobs",
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                font=dict(size=12),
-                yaxis_title="Employment Index (start = 100)",
-                xaxis_title="Date",
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="center",
-                    x=0.5,
-                ),
-            )
-            st.plotly_chart(fig_gap, use_container_width=True)
-
-            # Secondary chart: the gap itself as a bar chart
-            fig_gap_bars = go.Figure()
-            colors = ["#d62728" if g > 0 else "#2ca02c" for g in occ["displacement_gap"]]
-            fig_gap_bars.add_trace(
-                go.Bar(
-                    x=occ["date"],
-                    y=occ["displacement_gap"],
-                    marker_color=colors,
-                    name="Displacement Gap",
-                )
-            )
-            # Threshold line at 15pp
-            fig_gap_bars.add_hline(
-                y=15,
-                line_dash="dash",
-                line_color="red",
-                annotation_text="Takeoff threshold (15pp)",
-                annotation_position="top left",
-            )
-            fig_gap_bars.add_hline(y=0, line_color="#999", line_width=1)
+    if data["tfp"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["tfp"],
+                "date",
+                "tfp_index",
+                "Total Factor Productivity (2017=100)",
+                {"date": "Date", "tfp_index": "TFP Index"},
+                "#e377c2",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 [FRED MFPNFBS]"
+            "(https://fred.stlouisfed.org/series/MFPNFBS)"
+            " — Annual, BLS Multifactor Productivity"
+        )
 
-            fig_gap_bars.update_layout(
-                title="Displacement Gap Over Time (Non-Automatable - AI-Targetable)",
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                font=dict(size=12),
-                yaxis_title="Gap (pp)",
-                xaxis_title="Date",
-                showlegend=False,
-            )
-            st.plotly_chart(fig_gap_bars, use_container_width=True)
+    if data["capital_labor"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["capital_labor"],
+                "date",
+                "capital_labor_ratio",
+                "Capital-to-Labor Input Ratio (2017=1.0)",
+                {"date": "Date", "capital_labor_ratio": "Ratio"},
+                "#17becf",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 [FRED MPU4910042/MPU4910052]"
+            "(https://fred.stlouisfed.org/series/MPU4910042)"
+            " — Annual, BLS MFP Dataset"
+        )
 
-            st.caption(
-                "📊 FRED CPS/CES — **AI-Targetable**: Office/Admin, Legal, "
-                "Sales, Computer/Math | **Non-Automatable**: Construction, "
-                "Healthcare, Healthcare Support | "
-                "Red shading = gap widening (displacement signal)"
-            )
+    if data["occupation"] is not None:
+        occ = data["occupation"]
 
-        st.subheader("💰 Wage & Distribution")
-
-        if data["median_wages"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["median_wages"],
-                    "date",
-                    "median_weekly_earnings",
-                    "Real Median Weekly Earnings (constant 1982-84 $)",
-                    {"date": "Date", "median_weekly_earnings": "$ (real)"},
-                    "#2ca02c",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED LES1252881600Q]"
-                "(https://fred.stlouisfed.org/series/LES1252881600Q)"
-                " — Quarterly, BLS CPS. THE displacement outcome metric. "
-                "Declining real wages during productivity growth = the "
-                "economy growing while workers get poorer."
-            )
+        fig_gap, fig_gap_bars = build_occupation_charts(occ, frame_key(occ))
+        st.plotly_chart(fig_gap, use_container_width=True)
+        st.plotly_chart(fig_gap_bars, use_container_width=True)
 
-        if data["info_jobs_per_grad"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["info_jobs_per_grad"],
-                    "date",
-                    "info_jobs_per_grad",
-                    "Knowledge Jobs per 100 Graduates (Info Sector / College Labor Force)",
-                    {"date": "Date", "info_jobs_per_grad": "Jobs per 100 grads"},
-                    "#d62728",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 FRED USINFO / LNS11027662"
-                " — Monthly, BLS. Information sector employment divided "
-                "by college-educated labor force. Declining ratio = fewer "
-                "knowledge jobs chasing more graduates. Unlike wages "
-                "(which reflect survivors), this catches structural "
-                "demand erosion."
-            )
+        st.caption(
+            "📊 FRED CPS/CES — **AI-Targetable**: Office/Admin, Legal, "
+            "Sales, Computer/Math | **Non-Automatable**: Construction, "
+            "Healthcare, Healthcare Support | "
+            "Red shading = gap widening (displacement signal)"
+        )
+
+    st.subheader("💰 Wage & Distribution")
 
+    if data["median_wages"] is not None:
         st.plotly_chart(
             make_chart(
-                data["labor_share"],
+                data["median_wages"],
                 "date",
-                "labor_share_index",
-                "Labor Share of Income Index",
-                {"date": "Date", "labor_share_index": "Index"},
-                "#1f77b4",
+                "median_weekly_earnings",
+                "Real Median Weekly Earnings (constant 1982-84 $)",
+                {"date": "Date", "median_weekly_earnings": "$ (real)"},
+                "#2ca02c",
             ),
             use_container_width=True,
         )
-        st.caption("📊 [FRED PRS85006173](https://fred.stlouisfed.org/series/PRS85006173)")
-
-        st.subheader("🏥 Labour Market Health")
-
-        if data["prime_age_epop"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["prime_age_epop"],
-                    "date",
-                    "prime_age_epop",
-                    "Prime-Age (25-54) Employment-Population Ratio",
-                    {"date": "Date", "prime_age_epop": "% Employed"},
-                    "#e377c2",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED LNS12300060]"
-                "(https://fred.stlouisfed.org/series/LNS12300060)"
-                " — Monthly, BLS. The most honest measure of whether "
-                "working-age people are actually working. Decline during "
-                "GDP growth = structural displacement."
-            )
+        st.caption(
+            "📊 [FRED LES1252881600Q]"
+            "(https://fred.stlouisfed.org/series/LES1252881600Q)"
+            " — Quarterly, BLS CPS. THE displacement outcome metric. "
+            "Declining real wages during productivity growth = the "
+            "economy growing while workers get poorer."
+        )
 
-        if data["quits_rate"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["quits_rate"],
-                    "date",
-                    "quits_rate",
-                    "Quits Rate (Total Nonfarm, JOLTS)",
-                    {"date": "Date", "quits_rate": "Rate (%)"},
-                    "#17becf",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED JTSQUR]"
-                "(https://fred.stlouisfed.org/series/JTSQUR)"
-                " — Monthly, BLS JOLTS. Workers quit when they can "
-                "find something better. Declining quits in a growing "
-                "economy = workers feel trapped."
-            )
+    if data["info_jobs_per_grad"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["info_jobs_per_grad"],
+                "date",
+                "info_jobs_per_grad",
+                "Knowledge Jobs per 100 Graduates (Info Sector / College Labor Force)",
+                {"date": "Date", "info_jobs_per_grad": "Jobs per 100 grads"},
+                "#d62728",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 FRED USINFO / LNS11027662"
+            " — Monthly, BLS. Information sector employment divided "
+            "by college-educated labor force. Declining ratio = fewer "
+            "knowledge jobs chasing more graduates. Unlike wages "
+            "(which reflect survivors), this catches structural "
+            "demand erosion."
+        )
 
-        if data["unemployment"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["unemployment"],
-                    "date",
-                    "graduate_unemployment_rate",
-                    "Unemployment: Bachelor's+ (25+)",
-                    {"date": "Date", "graduate_unemployment_rate": "%"},
-                    "#d62728",
-                ),
-                use_container_width=True,
-            )
-            st.caption("📊 [FRED LNU04027662](https://fred.stlouisfed.org/series/LNU04027662)")
-
-        st.subheader("📈 AI Investment Scale")
-
-        if data["nvidia"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["nvidia"],
-                    "date",
-                    "revenue_millions",
-                    "NVIDIA Quarterly Revenue",
-                    {"date": "Date", "revenue_millions": "Revenue ($M)"},
-                    "#76b900",
-                    chart_type="bar",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [SEC EDGAR XBRL](https://data.sec.gov/api/xbrl/companyfacts/CIK0001045810.json)"
-            )
-            st.info(
-                "**Deployment-blind metric:** NVIDIA revenue measures AI compute "
-                "investment, not whether that compute is deployed for worker "
-                "augmentation or replacement. The same spending could produce "
-                "mass displacement or broad-based productivity gains depending "
-                "on institutional choices. Interpret alongside distribution "
-                "indicators. (Acemoglu & Johnson, 2023)"
-            )
+    st.plotly_chart(
+        make_chart(
+            data["labor_share"],
+            "date",
+            "labor_share_index",
+            "Labor Share of Income Index",
+            {"date": "Date", "labor_share_index": "Index"},
+            "#1f77b4",
+        ),
+        use_container_width=True,
+    )
+    st.caption("📊 [FRED PRS85006173](https://fred.stlouisfed.org/series/PRS85006173)")
 
-        if data["it_equipment"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["it_equipment"],
-                    "date",
-                    "it_equipment_investment",
-                    "Real Private Investment: Information Processing Equipment ($B, 2017)",
-                    {"date": "Date", "it_equipment_investment": "Billions (chained 2017$)"},
-                    "#636EFA",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED Y033RC1Q027SBEA]"
-                "(https://fred.stlouisfed.org/series/Y033RC1Q027SBEA)"
-                " — Quarterly, BEA. Hardware side of AI capex — servers, "
-                "GPUs, networking gear. Broader than NVIDIA alone."
-            )
+    st.subheader("🏥 Labour Market Health")
 
-        if data["software_investment"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["software_investment"],
-                    "date",
-                    "software_investment",
-                    "Real Private Investment: Software ($B, 2017)",
-                    {"date": "Date", "software_investment": "Billions (chained 2017$)"},
-                    "#9467bd",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED B985RC1Q027SBEA]"
-                "(https://fred.stlouisfed.org/series/B985RC1Q027SBEA)"
-                " — Quarterly, BEA. Software side of AI capex — cloud AI, "
-                "enterprise platforms, SaaS tools."
-            )
+    if data["prime_age_epop"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["prime_age_epop"],
+                "date",
+                "prime_age_epop",
+                "Prime-Age (25-54) Employment-Population Ratio",
+                {"date": "Date", "prime_age_epop": "% Employed"},
+                "#e377c2",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 [FRED LNS12300060]"
+            "(https://fred.stlouisfed.org/series/LNS12300060)"
+            " — Monthly, BLS. The most honest measure of whether "
+            "working-age people are actually working. Decline during "
+            "GDP growth = structural displacement."
+        )
 
-        # --- Reinstatement & Compensation Indicators ---
-        st.subheader("🔄 Reinstatement Indicators")
-        st.markdown(
-            "*These contextual indicators track whether compensation mechanisms "
-            "are working — whether AI-driven gains create new tasks and flow "
-            "to workers, or concentrate in capital returns. "
-            "(Acemoglu & Restrepo, 2019)*"
+    if data["quits_rate"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["quits_rate"],
+                "date",
+                "quits_rate",
+                "Quits Rate (Total Nonfarm, JOLTS)",
+                {"date": "Date", "quits_rate": "Rate (%)"},
+                "#17becf",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 [FRED JTSQUR]"
+            "(https://fred.stlouisfed.org/series/JTSQUR)"
+            " — Monthly, BLS JOLTS. Workers quit when they can "
+            "find something better. Declining quits in a growing "
+            "economy = workers feel trapped."
         )
 
-        # Compensation Health Index (derived from existing data)
-        comp_health = compute_compensation_health(data["labor_share"], data["gdp_per_capita"])
-        if len(comp_health) > 0:
-            colors = [
-                "#2ca02c" if v >= 0 else "#d62728" for v in comp_health["compensation_health"]
-            ]
-            fig_comp = go.Figure()
-            fig_comp.add_trace(
-                go.Bar(
-                    x=comp_health["date"],
-                    y=comp_health["compensation_health"],
-                    marker_color=colors,
-                    name="Compensation Health",
-                )
-            )
-            fig_comp.add_hline(y=0, line_color="#999", line_width=2)
-            fig_comp.update_layout(
-                title="Compensation Health Index (GDP Growth + Labor Share Change)",
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                font=dict(size=12),
-                yaxis_title="Index",
-                xaxis_title="Date",
-                showlegend=False,
-            )
-            st.plotly_chart(fig_comp, use_container_width=True)
-            st.caption(
-                "**Green** = economic gains shared with workers. "
-                "**Red** = GDP growth concentrating in capital returns "
-                "while labor share declines — a sign that reinstatement "
-                "(new task creation) is failing to offset automation. "
-                "Based on Acemoglu & Restrepo (2019) task framework."
-            )
+    if data["unemployment"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["unemployment"],
+                "date",
+                "graduate_unemployment_rate",
+                "Unemployment: Bachelor's+ (25+)",
+                {"date": "Date", "graduate_unemployment_rate": "%"},
+                "#d62728",
+            ),
+            use_container_width=True,
+        )
+        st.caption("📊 [FRED LNU04027662](https://fred.stlouisfed.org/series/LNU04027662)")
 
-        # Business Applications chart
-        if data["business_applications"] is not None:
-            st.plotly_chart(
-                make_chart(
-                    data["business_applications"],
-                    "date",
-                    "business_applications",
-                    "New Business Applications (Employer ID Numbers)",
-                    {"date": "Date", "business_applications": "Applications"},
-                    "#ff7f0e",
-                ),
-                use_container_width=True,
-            )
-            st.caption(
-                "📊 [FRED BABATOTALSAUS]"
-                "(https://fred.stlouisfed.org/series/BABATOTALSAUS)"
-                " — Monthly, Census Bureau. High new business formation "
-                "indicates reinstatement is working (new tasks/industries "
-                "emerging). Sustained decline alongside displacement signals "
-                "suggests automation without offsetting job creation."
-            )
+    st.subheader("📈 AI Investment Scale")
 
-    with tab2:
-        st.header("🎯 AI Transformation Analysis")
-        st.markdown(
-            "How close are current indicators to **specific, historically "
-            "abnormal** thresholds that would signal structural economic "
-            "transformation driven by AI?"
+    if data["nvidia"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["nvidia"],
+                "date",
+                "revenue_millions",
+                "NVIDIA Quarterly Revenue",
+                {"date": "Date", "revenue_millions": "Revenue ($M)"},
+                "#76b900",
+                chart_type="bar",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 [SEC EDGAR XBRL](https://data.sec.gov/api/xbrl/companyfacts/CIK0001045810.json)"
+        )
+        st.info(
+            "**Deployment-blind metric:** NVIDIA revenue measures AI compute "
+            "investment, not whether that compute is deployed for worker "
+            "augmentation or replacement. The same spending could produce "
+            "mass displacement or broad-based productivity gains depending "
+            "on institutional choices. Interpret alongside distribution "
+            "indicators. (Acemoglu & Johnson, 2023)"
         )
 
-        # Prepare aligned datasets for scoring
-        scoring_data = {
-            "labor_share": data["labor_share"],
-            "nvidia": data["nvidia"],
-            "tfp": data["tfp"],
-            "capital_labor": data["capital_labor"],
-        }
+    if data["it_equipment"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["it_equipment"],
+                "date",
+                "it_equipment_investment",
+                "Real Private Investment: Information Processing Equipment ($B, 2017)",
+                {"date": "Date", "it_equipment_investment": "Billions (chained 2017$)"},
+                "#636EFA",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 [FRED Y033RC1Q027SBEA]"
+            "(https://fred.stlouisfed.org/series/Y033RC1Q027SBEA)"
+            " — Quarterly, BEA. Hardware side of AI capex — servers, "
+            "GPUs, networking gear. Broader than NVIDIA alone."
+        )
 
-        if data["unemployment"] is not None:
-            scoring_data["unemployment_q"] = align_to_quarterly(data["unemployment"])
-        if data["occupation"] is not None:
-            scoring_data["occupation_q"] = align_to_quarterly(data["occupation"])
-        if data["prime_age_epop"] is not None:
-            scoring_data["prime_age_epop_q"] = align_to_quarterly(data["prime_age_epop"])
-        if data["quits_rate"] is not None:
-            scoring_data["quits_rate_q"] = align_to_quarterly(data["quits_rate"])
-        if data["it_equipment"] is not None:
-            scoring_data["it_equipment"] = data["it_equipment"]
-        if data["median_wages"] is not None:
-            scoring_data["median_wages"] = data["median_wages"]
-        if data["info_jobs_per_grad"] is not None:
-            scoring_data["info_jobs_per_grad_q"] = align_to_quarterly(
-                data["info_jobs_per_grad"]
-            )
-        if data["software_investment"] is not None:
-            scoring_data["software_investment"] = data["software_investment"]
-
-        takeoff_metrics = compute_takeoff_metrics(scoring_data)
-        takeoff_score = compute_takeoff_score(takeoff_metrics)
-
-        # Score display with diffusion index
-        if takeoff_score >= 60:
-            sc, sl = "🔴", "Rapid Transformation"
-        elif takeoff_score >= 30:
-            sc, sl = "🟡", "Emerging Signal"
-        else:
-            sc, sl = "🟢", "No Signal"
-
-        col_score, col_early_d, col_full_d = st.columns(3)
-        with col_score:
-            st.metric(
-                label=f"{sc} AI Transformation Index",
-                value=f"{takeoff_score:.1f} / 100",
-                help=sl,
-            )
-        with col_early_d:
-            early_n, early_t, _ = compute_diffusion_index(takeoff_metrics, "early")
-            st.metric(
-                "Early Warning Breadth",
-                f"{early_n} / {early_t} metrics",
-                help="Metrics above early-warning threshold (~1/3 of full)",
-            )
-        with col_full_d:
-            full_n, full_t, _ = compute_diffusion_index(takeoff_metrics, "full")
-            st.metric(
-                "Full Threshold Breadth",
-                f"{full_n} / {full_t} metrics",
-                help="Metrics at or above full transformation threshold",
-            )
+    if data["software_investment"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["software_investment"],
+                "date",
+                "software_investment",
+                "Real Private Investment: Software ($B, 2017)",
+                {"date": "Date", "software_investment": "Billions (chained 2017$)"},
+                "#9467bd",
+            ),
+            use_container_width=True,
+        )
         st.caption(
-            "**Diffusion breadth matters:** 2 metrics at threshold could be "
-            "coincidence; 6+ simultaneous signals across independent indicators "
-            "would be structurally significant. National averages can mask "
-            "concentrated harm — broad diffusion increases confidence that "
-            "effects are economy-wide."
+            "📊 [FRED B985RC1Q027SBEA]"
+            "(https://fred.stlouisfed.org/series/B985RC1Q027SBEA)"
+            " — Quarterly, BEA. Software side of AI capex — cloud AI, "
+            "enterprise platforms, SaaS tools."
         )
-        st.divider()
 
-        # --- Radar chart: overall shape of takeoff signal ---
-        st.subheader("🕸 Transformation Radar")
-        radar_labels = []
-        radar_progress = []
-        radar_consistency = []
-        for key in TAKEOFF_THRESHOLDS:
-            if key in takeoff_metrics:
-                radar_labels.append(TAKEOFF_THRESHOLDS[key]["label"])
-                radar_progress.append(min(100, takeoff_metrics[key]["progress"] * 100))
-                radar_consistency.append(takeoff_metrics[key]["consistency"] * 100)
-
-        if radar_labels:
-            fig_radar = go.Figure()
-            fig_radar.add_trace(
-                go.Scatterpolar(
-                    r=radar_progress + [radar_progress[0]],
-                    theta=radar_labels + [radar_labels[0]],
-                    fill="toself",
-                    name="Progress toward threshold",
-                    fillcolor="rgba(99, 110, 250, 0.2)",
-                    line=dict(color="#636EFA", width=2),
-                )
+    # --- Reinstatement & Compensation Indicators ---
+    st.subheader("🔄 Reinstatement Indicators")
+    st.markdown(
+        "*These contextual indicators track whether compensation mechanisms "
+        "are working — whether AI-driven gains create new tasks and flow "
+        "to workers, or concentrate in capital returns. "
+        "(Acemoglu & Restrepo, 2019)*"
+    )
+
+    # Compensation Health Index (derived from existing data)
+    comp_health = compute_compensation_health(data["labor_share"], data["gdp_per_capita"])
+    if len(comp_health) > 0:
+        colors = ["#2ca02c" if v >= 0 else "#d62728" for v in comp_health["compensation_health"]]
+        fig_comp = go.Figure()
+        fig_comp.add_trace(
+            go.Bar(
+                x=comp_health["date"],
+                y=comp_health["compensation_health"],
+                marker_color=colors,
+                name="Compensation Health",
             )
-            fig_radar.add_trace(
-                go.Scatterpolar(
-                    r=radar_consistency + [radar_consistency[0]],
-                    theta=radar_labels + [radar_labels[0]],
-                    fill="toself",
-                    name="Trend consistency",
-                    fillcolor="rgba(239, 85, 59, 0.15)",
-                    line=dict(color="#EF553B", width=2, dash="dot"),
-                )
+        )
+        fig_comp.add_hline(y=0, line_color="#999", line_width=2)
+        fig_comp.update_layout(
+            title="Compensation Health Index (GDP Growth + Labor Share Change)",
+            **BASE_LAYOUT,
+            yaxis_title="Index",
+            xaxis_title="Date",
+            showlegend=False,
+        )
+        st.plotly_chart(fig_comp, use_container_width=True)
+        st.caption(
+            "**Green** = economic gains shared with workers. "
+            "**Red** = GDP growth concentrating in capital returns "
+            "while labor share declines — a sign that reinstatement "
+            "(new task creation) is failing to offset automation. "
+            "Based on Acemoglu & Restrepo (2019) task framework."
+        )
+
+    # Business Applications chart
+    if data["business_applications"] is not None:
+        st.plotly_chart(
+            make_chart(
+                data["business_applications"],
+                "date",
+                "business_applications",
+                "New Business Applications (Employer ID Numbers)",
+                {"date": "Date", "business_applications": "Applications"},
+                "#ff7f0e",
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "📊 [FRED BABATOTALSAUS]"
+            "(https://fred.stlouisfed.org/series/BABATOTALSAUS)"
+            " — Monthly, Census Bureau. High new business formation "
+            "indicates reinstatement is working (new tasks/industries "
+            "emerging). Sustained decline alongside displacement signals "
+            "suggests automation without offsetting job creation."
+        )
+
+
+@st.fragment
+def render_transformation_analysis(takeoff_metrics, takeoff_score):
+    """Render the takeoff scoring tab."""
+    st.header("🎯 AI Transformation Analysis")
+    st.markdown(
+        "How close are current indicators to **specific, historically "
+        "abnormal** thresholds that would signal structural economic "
+        "transformation driven by AI?"
+    )
+
+    # Score display with diffusion index
+    if takeoff_score >= 60:
+        sc, sl = "🔴", "Rapid Transformation"
+    elif takeoff_score >= 30:
+        sc, sl = "🟡", "Emerging Signal"
+    else:
+        sc, sl = "🟢", "No Signal"
+
+    col_score, col_early_d, col_full_d = st.columns(3)
+    with col_score:
+        st.metric(
+            label=f"{sc} AI Transformation Index",
+            value=f"{takeoff_score:.1f} / 100",
+            help=sl,
+        )
+    with col_early_d:
+        early_n, early_t, _ = compute_diffusion_index(takeoff_metrics, "early")
+        st.metric(
+            "Early Warning Breadth",
+            f"{early_n} / {early_t} metrics",
+            help="Metrics above early-warning threshold (~1/3 of full)",
+        )
+    with col_full_d:
+        full_n, full_t, _ = compute_diffusion_index(takeoff_metrics, "full")
+        st.metric(
+            "Full Threshold Breadth",
+            f"{full_n} / {full_t} metrics",
+            help="Metrics at or above full transformation threshold",
+        )
+    st.caption(
+        "**Diffusion breadth matters:** 2 metrics at threshold could be "
+        "coincidence; 6+ simultaneous signals across independent indicators "
+        "would be structurally significant. National averages can mask "
+        "concentrated harm — broad diffusion increases confidence that "
+        "effects are economy-wide."
+    )
+    st.divider()
+
+    # --- Radar chart: overall shape of takeoff signal ---
+    st.subheader("🕸 Transformation Radar")
+    radar_labels = []
+    radar_progress = []
+    radar_consistency = []
+    for key in TAKEOFF_THRESHOLDS:
+        if key in takeoff_metrics:
+            radar_labels.append(TAKEOFF_THRESHOLDS[key]["label"])
+            radar_progress.append(min(100, takeoff_metrics[key]["progress"] * 100))
+            radar_consistency.append(takeoff_metrics[key]["consistency"] * 100)
+
+    if radar_labels:
+        fig_radar = go.Figure()
+        fig_radar.add_trace(
+            go.Scatterpolar(
+                r=radar_progress + [radar_progress[0]],
+                theta=radar_labels + [radar_labels[0]],
+                fill="toself",
+                name="Progress toward threshold",
+                fillcolor="rgba(99, 110, 250, 0.2)",
+                line=dict(color="#636EFA", width=2),
             )
-            # 75% consistency target ring
-            target_ring = [75] * (len(radar_labels) + 1)
-            fig_radar.add_trace(
-                go.Scatterpolar(
-                    r=target_ring,
-                    theta=radar_labels + [radar_labels[0]],
-                    name="75% consistency target",
-                    line=dict(color="#888", width=1, dash="dash"),
-                    fill=None,
-                )
+        )
+        fig_radar.add_trace(
+            go.Scatterpolar(
+                r=radar_consistency + [radar_consistency[0]],
+                theta=radar_labels + [radar_labels[0]],
+                fill="toself",
+                name="Trend consistency",
+                fillcolor="rgba(239, 85, 59, 0.15)",
+                line=dict(color="#EF553B", width=2, dash="dot"),
             )
-            fig_radar.update_layout(
-                polar=dict(
-                    radialaxis=dict(visible=True, range=[0, 100], ticksuffix="%"),
-                ),
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.2,
-                    xanchor="center",
-                    x=0.5,
-                ),
-                height=500,
-                margin=dict(t=40, b=80),
+        )
+        # 75% consistency target ring
+        target_ring = [75] * (len(radar_labels) + 1)
+        fig_radar.add_trace(
+            go.Scatterpolar(
+                r=target_ring,
+                theta=radar_labels + [radar_labels[0]],
+                name="75% consistency target",
+                line=dict(color="#888", width=1, dash="dash"),
+                fill=None,
             )
-            st.plotly_chart(fig_radar, use_container_width=True)
-            st.caption(
-                "Blue fill = progress toward threshold. "
-                "Red dotted = trend consistency. "
-                "Gray dashed = 75% consistency target."
+        )
+        fig_radar.update_layout(
+            polar=dict(
+                radialaxis=dict(visible=True, range=[0, 100], ticksuffix="%"),
+            ),
+            showlegend=True,
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=-0.2,
+                xanchor="center",
+                x=0.5,
+            ),
+            height=500,
+            margin=dict(t=40, b=80),
+        )
+        st.plotly_chart(fig_radar, use_container_width=True)
+        st.caption(
+            "Blue fill = progress toward threshold. "
+            "Red dotted = trend consistency. "
+            "Gray dashed = 75% consistency target."
+        )
+
+    st.divider()
+
+    # --- Horizontal bar chart: all metrics progress at a glance ---
+    st.subheader("📊 Progress Toward Transformation Thresholds")
+
+    bar_data = []
+    for cat_name, cat_keys in METRIC_CATEGORIES.items():
+        for key in cat_keys:
+            if key not in takeoff_metrics:
+                continue
+            m = takeoff_metrics[key]
+            info = TAKEOFF_THRESHOLDS[key]
+            bar_data.append(
+                {
+                    "Metric": info["label"],
+                    "Progress (%)": min(100, m["progress"] * 100),
+                    "Category": cat_name,
+                    "Consistency": m["consistency"] * 100,
+                }
             )
 
-        st.divider()
+    if bar_data:
+        bar_df = pd.DataFrame(bar_data)
+        cat_colors = {
+            "Structural Shifts": "#636EFA",
+            "Wage & Distribution": "#EF553B",
+            "Labour Market Health": "#AB63FA",
+            "AI Investment Scale": "#00CC96",
+        }
+        fig_bars = px.bar(
+            bar_df,
+            x="Progress (%)",
+            y="Metric",
+            color="Category",
+            orientation="h",
+            color_discrete_map=cat_colors,
+            text="Progress (%)",
+        )
+        fig_bars.update_traces(texttemplate="%{text:.0f}%", textposition="outside")
+        # Early warning line at ~33%
+        fig_bars.add_vline(
+            x=33,
+            line_dash="dot",
+            line_color="#ff7f0e",
+            annotation_text="Early Warning",
+            annotation_position="top left",
+        )
+        # Full threshold line at 100%
+        fig_bars.add_vline(
+            x=100,
+            line_dash="dash",
+            line_color="red",
+            annotation_text="Full Threshold",
+            annotation_position="top right",
+        )
+        fig_bars.update_layout(
+            xaxis=dict(range=[0, max(110, bar_df["Progress (%)"].max() + 10)]),
+            yaxis=dict(autorange="reversed"),
+            plot_bgcolor="white",
+            paper_bgcolor="white",
+            height=400,
+            showlegend=True,
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=-0.3,
+                xanchor="center",
+                x=0.5,
+            ),
+        )
+        st.plotly_chart(fig_bars, use_container_width=True)
 
-        # --- Horizontal bar chart: all metrics progress at a glance ---
-        st.subheader("📊 Progress Toward Transformation Thresholds")
+    st.divider()
 
-        bar_data = []
-        for cat_name, cat_keys in METRIC_CATEGORIES.items():
-            for key in cat_keys:
-                if key not in takeoff_metrics:
-                    continue
-                m = takeoff_metrics[key]
-                info = TAKEOFF_THRESHOLDS[key]
-                bar_data.append(
-                    {
-                        "Metric": info["label"],
-                        "Progress (%)": min(100, m["progress"] * 100),
-                        "Category": cat_name,
-                        "Consistency": m["consistency"] * 100,
-                    }
+    # --- Individual metric gauges with detail ---
+    st.subheader("🔍 Metric-by-Metric Detail")
+
+    for cat_name, cat_keys in METRIC_CATEGORIES.items():
+        icon = CATEGORY_ICONS.get(cat_name, "")
+        st.markdown(f"**{icon} {cat_name}**")
+
+        gauges = []
+        stats_rows = {}
+        for key in cat_keys:
+            info = TAKEOFF_THRESHOLDS[key]
+
+            if key not in takeoff_metrics:
+                st.warning(f"Insufficient data for {info['label']}")
+                continue
+
+            m = takeoff_metrics[key]
+            prog_pct = m["progress"] * 100
+            cons_pct = m["consistency"] * 100
+
+            if m["score"] >= 0.75:
+                status = "🔴 At/above threshold"
+            elif m["score"] >= 0.30:
+                status = "🟡 Approaching"
+            else:
+                status = "🟢 Below threshold"
+
+            unit = info["unit"]
+            metric_type = info.get("metric_type", "change")
+            if metric_type == "level":
+                change_str = f"${m['raw_change'] / 1000:,.0f}B"
+                thresh_str = f"${info['threshold'] / 1000:,.0f}B"
+            elif unit == "pp":
+                change_str = f"{m['raw_change']:+.1f}pp"
+                thresh_str = (
+                    f"{info['threshold']:.0f}pp "
+                    f"{'decline' if info['direction'] == 'decline' else 'rise'}"
+                )
+            else:
+                change_str = f"{m['raw_change']:+.1f}%"
+                thresh_str = (
+                    f"{info['threshold']:.0f}% "
+                    f"{'decline' if info['direction'] == 'decline' else 'growth'}"
                 )
 
-        if bar_data:
-            bar_df = pd.DataFrame(bar_data)
-            cat_colors = {
-                "Structural Shifts": "#636EFA",
-                "Wage & Distribution": "#EF553B",
-                "Labour Market Health": "#AB63FA",
-                "AI Investment Scale": "#00CC96",
-            }
-            fig_bars = px.bar(
-                bar_df,
-                x="Progress (%)",
-                y="Metric",
-                color="Category",
-                orientation="h",
-                color_discrete_map=cat_colors,
-                text="Progress (%)",
-            )
-            fig_bars.update_traces(texttemplate="%{text:.0f}%", textposition="outside")
-            # Early warning line at ~33%
-            fig_bars.add_vline(
-                x=33,
-                line_dash="dot",
-                line_color="#ff7f0e",
-                annotation_text="Early Warning",
-                annotation_position="top left",
+            # Early warning percentage for this metric
+            early_pct = info["early_threshold"] / info["threshold"] * 100
+
+            # Bullet gauge for this metric
+            fig_gauge = go.Figure(
+                go.Indicator(
+                    mode="gauge+number",
+                    value=min(prog_pct, 150),
+                    number={"suffix": "%"},
+                    gauge=dict(
+                        axis=dict(range=[0, 150]),
+                        bar=dict(
+                            color=(
+                                "#d62728"
+                                if prog_pct >= 100
+                                else "#ff7f0e"
+                                if prog_pct >= early_pct
+                                else "#2ca02c"
+                            )
+                        ),
+                        steps=[
+                            {"range": [0, early_pct], "color": "#f0f0f0"},
+                            {"range": [early_pct, 100], "color": "#fff3e0"},
+                            {"range": [100, 150], "color": "#ffe0e0"},
+                        ],
+                        threshold=dict(
+                            line=dict(color="red", width=3),
+                            thickness=0.8,
+                            value=100,
+                        ),
+                    ),
+                    title={"text": info["label"]},
+                )
             )
-            # Full threshold line at 100%
-            fig_bars.add_vline(
-                x=100,
-                line_dash="dash",
-                line_color="red",
-                annotation_text="Full Threshold",
-                annotation_position="top right",
+            fig_gauge.update_layout(
+                height=200,
+                margin=dict(t=60, b=20, l=30, r=30),
             )
-            fig_bars.update_layout(
-                xaxis=dict(range=[0, max(110, bar_df["Progress (%)"].max() + 10)]),
-                yaxis=dict(autorange="reversed"),
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                height=400,
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.3,
-                    xanchor="center",
-                    x=0.5,
-                ),
-            )
-            st.plotly_chart(fig_bars, use_container_width=True)
+            gauges.append(fig_gauge)
+
+            stats_rows[info["label"]] = {
+                "Status": status,
+                "Measure": "Current" if metric_type == "level" else "3yr Change",
+                "Value": change_str,
+                "Threshold": thresh_str,
+                "Consistency": cons_pct,
+            }
+
+        if not gauges:
+            continue
 
+        # One row of gauges and one table per category, instead of a
+        # columns layout and three st.metric widgets per metric
+        for col, fig_gauge in zip(st.columns(len(gauges)), gauges, strict=True):
+            with col:
+                st.plotly_chart(fig_gauge, use_container_width=True)
+        st.dataframe(
+            pd.DataFrame.from_dict(stats_rows, orient="index"),
+            column_config={
+                "Consistency": st.column_config.ProgressColumn(
+                    f"Consistency (target {CONSISTENCY_TARGET:.0%})",
+                    format="%.0f%%",
+                    min_value=0,
+                    max_value=100,
+                ),
+            },
+        )
         st.divider()
 
-        # --- Individual metric gauges with detail ---
-        st.subheader("🔍 Metric-by-Metric Detail")
+    # Summary
+    st.subheader("🔍 Current Assessment")
+    at_thresh = [k for k, v in takeoff_metrics.items() if v["progress"] >= 1.0]
+    early_warn = [
+        k for k, v in takeoff_metrics.items() if v["progress"] >= 0.33 and v["progress"] < 1.0
+    ]
+    consistent = [k for k, v in takeoff_metrics.items() if v["consistency"] >= CONSISTENCY_TARGET]
+    active = [k for k, v in takeoff_metrics.items() if v["score"] > 0.30]
+    total = len(TAKEOFF_THRESHOLDS)
 
-        for cat_name, cat_keys in METRIC_CATEGORIES.items():
-            icon = CATEGORY_ICONS.get(cat_name, "")
-            st.markdown(f"**{icon} {cat_name}**")
+    def label_list(keys):
+        return ", ".join(TAKEOFF_THRESHOLDS[k]["label"] for k in keys) or "None"
 
-            for key in cat_keys:
-                info = TAKEOFF_THRESHOLDS[key]
+    st.markdown(f"""
+    **At/above full threshold:** {label_list(at_thresh)}
 
-                if key not in takeoff_metrics:
-                    st.warning(f"Insufficient data for {info['label']}")
-                    continue
-
-                m = takeoff_metrics[key]
-                prog_pct = m["progress"] * 100
-                cons_pct = m["consistency"] * 100
-
-                if m["score"] >= 0.75:
-                    status = "🔴 At/above threshold"
-                elif m["score"] >= 0.30:
-                    status = "🟡 Approaching"
-                else:
-                    status = "🟢 Below threshold"
-
-                unit = info["unit"]
-                metric_type = info.get("metric_type", "change")
-                if metric_type == "level":
-                    change_str = f"${m['raw_change'] / 1000:,.0f}B"
-                    thresh_str = f"${info['threshold'] / 1000:,.0f}B"
-                elif unit == "pp":
-                    change_str = f"{m['raw_change']:+.1f}pp"
-                    thresh_str = (
-                        f"{info['threshold']:.0f}pp "
-                        f"{'decline' if info['direction'] == 'decline' else 'rise'}"
-                    )
-                else:
-                    change_str = f"{m['raw_change']:+.1f}%"
-                    thresh_str = (
-                        f"{info['threshold']:.0f}% "
-                        f"{'decline' if info['direction'] == 'decline' else 'growth'}"
-                    )
-
-                with st.container():
-                    st.markdown(f"**{info['label']}** — {status}")
-
-                    col_gauge, col_stats = st.columns([3, 2])
-
-                    with col_gauge:
-                        # Early warning percentage for this metric
-                        early_pct = info["early_threshold"] / info["threshold"] * 100
-
-                        # Bullet gauge for this metric
-                        fig_gauge = go.Figure(
-                            go.Indicator(
-                                mode="gauge+number",
-                                value=min(prog_pct, 150),
-                                number={"suffix": "%"},
-                                gauge=dict(
-                                    axis=dict(range=[0, 150]),
-                                    bar=dict(
-                                        color=(
-                                            "#d62728"
-                                            if prog_pct >= 100
-                                            else "#ff7f0e"
-                                            if prog_pct >= early_pct
-                                            else "#2ca02c"
-                                        )
-                                    ),
-                                    steps=[
-                                        {"range": [0, early_pct], "color": "#f0f0f0"},
-                                        {"range": [early_pct, 100], "color": "#fff3e0"},
-                                        {"range": [100, 150], "color": "#ffe0e0"},
-                                    ],
-                                    threshold=dict(
-                                        line=dict(color="red", width=3),
-                                        thickness=0.8,
-                                        value=100,
-                                    ),
-                                ),
-                                title={"text": "Progress"},
-                            )
-                        )
-                        fig_gauge.update_layout(
-                            height=200,
-                            margin=dict(t=60, b=20, l=30, r=30),
-                        )
-                        st.plotly_chart(fig_gauge, use_container_width=True)
-
-                    with col_stats:
-                        value_label = "Current" if metric_type == "level" else "3yr Change"
-                        st.metric(value_label, change_str)
-                        st.metric("Threshold", thresh_str)
-                        cons_delta = "Above" if cons_pct >= 75 else "Below"
-                        st.metric(
-                            "Consistency",
-                            f"{cons_pct:.0f}%",
-                            delta=f"{cons_delta} 75% target",
-                            delta_color=("normal" if cons_pct >= 75 else "inverse"),
-                        )
-
-                    st.divider()
-
-        # Summary
-        st.subheader("🔍 Current Assessment")
-        at_thresh = [k for k, v in takeoff_metrics.items() if v["progress"] >= 1.0]
-        early_warn = [
-            k for k, v in takeoff_metrics.items() if v["progress"] >= 0.33 and v["progress"] < 1.0
-        ]
-        consistent = [
-            k for k, v in takeoff_metrics.items() if v["consistency"] >= CONSISTENCY_TARGET
-        ]
-        active = [k for k, v in takeoff_metrics.items() if v["score"] > 0.30]
-        total = len(TAKEOFF_THRESHOLDS)
+    **Early warning (above 1/3 threshold):** {label_list(early_warn)}
 
-        def label_list(keys):
-            return ", ".join(TAKEOFF_THRESHOLDS[k]["label"] for k in keys) or "None"
+    **Consistent trend (>75%):** {label_list(consistent)}
 
-        st.markdown(f"""
-        **At/above full threshold:** {label_list(at_thresh)}
+    **Active signal (score > 0.3):** {label_list(active)}
 
-        **Early warning (above 1/3 threshold):** {label_list(early_warn)}
+    **Structural transformation requires:** Multiple metrics at threshold
+    with >75% consistency. Currently **{len(at_thresh)}/{total}** at
+    full threshold, **{len(early_warn)}/{total}** at early warning,
+    **{len(consistent)}/{total}** consistent.
+    """)
 
-        **Consistent trend (>75%):** {label_list(consistent)}
+    st.info(
+        "**Reinstatement context:** This scoring system measures the "
+        "speed of potential displacement but not the reinstatement effect "
+        "(new task creation). Check the Reinstatement Indicators in the "
+        "Time Series tab — Business Applications and Compensation Health — "
+        "to assess whether the economy is creating offsetting new tasks. "
+        "Displacement without reinstatement is the critical signal. "
+        "(Acemoglu & Restrepo, 2019)"
+    )
 
-        **Active signal (score > 0.3):** {label_list(active)}
 
-        **Structural transformation requires:** Multiple metrics at threshold
-        with >75% consistency. Currently **{len(at_thresh)}/{total}** at
-        full threshold, **{len(early_warn)}/{total}** at early warning,
-        **{len(consistent)}/{total}** consistent.
-        """)
+# --- Dashboard rendering ---
+try:
+    data = load_data()
 
-        st.info(
-            "**Reinstatement context:** This scoring system measures the "
-            "speed of potential displacement but not the reinstatement effect "
-            "(new task creation). Check the Reinstatement Indicators in the "
-            "Time Series tab — Business Applications and Compensation Health — "
-            "to assess whether the economy is creating offsetting new tasks. "
-            "Displacement without reinstatement is the critical signal. "
-            "(Acemoglu & Restrepo, 2019)"
-        )
+    tab1, tab2, tab3, tab4 = st.tabs(
+        [
+            "📈 Time Series Charts",
+            "🎯 Transformation Analysis",
+            "🔮 Scenario Projections",
+            "📚 Methodology",
+        ]
+    )
+
+    takeoff_metrics, takeoff_score = load_takeoff_scores()
+
+    with tab1:
+        render_time_series(data)
+
+    with tab2:
+        render_transformation_analysis(takeoff_metrics, takeoff_score)
 
     with tab3:
         st.header("🔮 Scenario-Based Takeoff Projections")
@@ -1328,67 +1094,68 @@ try:
             "nvidia": 68127.0,  # Current NVIDIA $M/quarter
         }
 
-        score_rows = []
-        metric_rows = []
+        # Per-metric constants as arrays: each scenario is projected as one
+        # (years x metrics) matrix instead of a scalar loop per cell.
+        metric_keys = list(TAKEOFF_THRESHOLDS)
+        metric_labels = [TAKEOFF_THRESHOLDS[k]["label"] for k in metric_keys]
+        thresholds = np.array([TAKEOFF_THRESHOLDS[k]["threshold"] for k in metric_keys])
+        weights = np.array([TAKEOFF_THRESHOLDS[k]["weight"] for k in metric_keys])
+        is_level = np.array(
+            [TAKEOFF_THRESHOLDS[k].get("metric_type", "change") == "level" for k in metric_keys]
+        )
+
+        years_out = np.array(proj_years) - 2026
+        eff_years = np.minimum(years_out, 3)[:, None]
+        ramp = np.minimum(1.0, years_out / 5.0)[:, None]
+
+        score_frames = []
+        metric_frames = []
 
         for sname, sinfo in SCENARIOS.items():
-            rates = sinfo["rates"]
-
-            for yr in proj_years:
-                years_out = yr - 2026
-                eff_years = min(years_out, 3)
-
-                total_w = 0.0
-                w_sum = 0.0
-                n_active = 0
-
-                for key, info in TAKEOFF_THRESHOLDS.items():
-                    threshold = info["threshold"]
-                    weight = info["weight"]
-                    m_type = info.get("metric_type", "change")
-                    rate = rates.get(key, 0)
-
-                    if m_type == "level":
-                        current_val = current_levels.get(key, rate * 0.5)
-                        ramp = min(1.0, years_out / 5.0)
-                        proj_val = current_val + (rate - current_val) * ramp
-                        progress = max(0.0, proj_val / threshold)
-                        cons = 0.95 if rate > current_val else 0.5
-                    else:
-                        proj_3yr = rate * eff_years
-                        progress = max(0.0, proj_3yr / threshold)
-                        cons = min(0.95, 0.5 + rate / (threshold / 3) * 0.3) if rate > 0 else 0.4
-
-                    score = min(1.0, progress * cons)
-                    w_sum += weight * score
-                    total_w += weight
-                    if score > 0.3:
-                        n_active += 1
-
-                    metric_rows.append(
-                        {
-                            "Scenario": sname,
-                            "Year": yr,
-                            "Metric": info["label"],
-                            "Progress": min(progress * 100, 150),
-                        }
-                    )
-
-                base = w_sum / total_w if total_w > 0 else 0
-                coherence = 0.5 + 0.5 * (n_active / len(TAKEOFF_THRESHOLDS))
-                final = min(100.0, base * coherence * 100)
-
-                score_rows.append(
+            rates = np.array([sinfo["rates"].get(k, 0) for k in metric_keys], dtype=float)
+            current = np.array(
+                [current_levels.get(k, r * 0.5) for k, r in zip(metric_keys, rates, strict=True)]
+            )
+
+            # Level metrics ramp toward the scenario level over 5 years;
+            # change metrics accumulate the annual rate over the 3yr window.
+            proj_val = np.where(is_level, current + (rates - current) * ramp, rates * eff_years)
+            progress = np.maximum(0.0, proj_val / thresholds)
+            cons = np.where(
+                is_level,
+                np.where(rates > current, 0.95, 0.5),
+                np.where(rates > 0, np.minimum(0.95, 0.5 + rates / (thresholds / 3) * 0.3), 0.4),
+            )
+
+            scores = np.minimum(1.0, progress * cons)
+            n_active = np.count_nonzero(scores > 0.3, axis=1)
+            base = scores @ weights / weights.sum()
+            coherence = 0.5 + 0.5 * (n_active / len(metric_keys))
+            final = np.minimum(100.0, base * coherence * 100)
+
+            score_frames.append(
+                pd.DataFrame(
                     {
                         "Scenario": sname,
-                        "Year": yr,
+                        "Year": proj_years,
                         "Score": final,
                         "Active": n_active,
                     }
                 )
+            )
+            metric_frames.append(
+                pd.DataFrame(
+                    {
+                        "Scenario": sname,
+                        "Year": np.repeat(proj_years, len(metric_keys)),
+                        "Metric": metric_labels * len(proj_years),
+                        "Progress": np.minimum(progress * 100, 150).ravel(),
+                    }
+                )
+            )
 
-        score_df = pd.DataFrame(score_rows)
-        metric_df = pd.DataFrame(metric_rows)
+        score_df = pd.concat(score_frames, ignore_index=True)
+        metric_df = pd.concat(metric_frames, ignore_index=True)
 
         # --- Score trajectory chart ---
         st.subheader("📈 Projected Transformation Score Over Time")
@@ -1402,7 +1169,7 @@ try:
                     y=s_df["Score"],
                     mode="lines+markers+text",
                     name=sname,
-                    line=dict(color=sinfo["color"], width=3),
+                    line=dict(color=sinfo["color"], width=LINE_WIDTH),
                     marker=dict(size=8),
                     text=[f"{s:.0f}" for s in s_df["Score"]],
                     textposition="top center",
@@ -1496,6 +1263,7 @@ try:
 
         # --- Summary cards ---
         st.subheader("📊 Scenario Summary")
+        summary_rows = {}
         for sname, _sinfo in SCENARIOS.items():
             s_df = score_df[score_df["Scenario"] == sname]
             above_30 = s_df[s_df["Score"] >= 30]
@@ -1503,18 +1271,19 @@ try:
             s2032 = s_df[s_df["Year"] == 2032]["Score"].values
             s2032_str = f"{s2032[0]:.0f}" if len(s2032) > 0 else "N/A"
 
-            st.markdown(f"**{sname}:**")
-            c1, c2, c3 = st.columns(3)
-            c1.metric(
-                "Early Indicators (>30)",
-                str(above_30["Year"].min()) if len(above_30) > 0 else ">2040",
-            )
-            c2.metric(
-                "Strong Signal (>60)",
-                str(above_60["Year"].min()) if len(above_60) > 0 else ">2040",
-            )
-            c3.metric("Score in 2032", f"{s2032_str}/100")
-            st.divider()
+            summary_rows[sname] = {
+                "Early Indicators (>30)": (
+                    str(above_30["Year"].min()) if len(above_30) > 0 else ">2040"
+                ),
+                "Strong Signal (>60)": (
+                    str(above_60["Year"].min()) if len(above_60) > 0 else ">2040"
+                ),
+                "Score in 2032": f"{s2032_str}/100",
+            }
+
+        # One table render instead of a grid of st.metric widgets
+        st.dataframe(pd.DataFrame.from_dict(summary_rows, orient="index"))
+        st.divider()
 
         st.subheader("⚠️ Key Assumptions")
         st.markdown("""
@@ -0,0 +1,411 @@
+"""Processed-data loading and takeoff scoring shared by the dashboard and the pipeline."""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- Takeoff criteria ---
+# Each defines a 3-year threshold that would be historically abnormal.
+# Organized into three categories: Smoking Guns, Displacement Effects, Investment Causes.
+TAKEOFF_THRESHOLDS = {
+    # STRUCTURAL SHIFTS — hardest to explain without AI
+    "tfp": {
+        "label": "TFP Acceleration",
+        "threshold": 6.0,
+        "early_threshold": 2.0,
+        "unit": "%",
+        "direction": "rise",
+        "weight": 0.14,
+        "frequency": "annual",
+        "rationale": (
+            "TFP grows ~1%/yr historically. 2%/yr sustained (6% over 3 years) "
+            "means more output from the same inputs — the productivity signature of AI."
+        ),
+    },
+    "occupation_gap": {
+        "label": "AI Job Displacement Gap",
+        "threshold": 15.0,
+        "early_threshold": 5.0,
+        "unit": "pp",
+        "direction": "rise",
+        "weight": 0.13,
+        "frequency": "quarterly",
+        "rationale": (
+            "If AI-targetable occupations (office, legal, sales, tech) decline "
+            "while non-automatable (construction, healthcare) grow, a 15pp gap "
+            "over 3 years would be structural, not cyclical."
+        ),
+    },
+    "capital_labor": {
+        "label": "Capital-Labor Substitution",
+        "threshold": 12.0,
+        "early_threshold": 4.0,
+        "unit": "%",
+        "direction": "rise",
+        "weight": 0.10,
+        "frequency": "annual",
+        "rationale": (
+            "The capital-to-labor ratio rises ~1-2%/yr normally. "
+            "4%/yr (12% over 3 years) means firms are actively "
+            "replacing workers with capital (AI/software)."
+        ),
+    },
+    # WAGE & DISTRIBUTION — who benefits from AI gains
+    "median_wages": {
+        "label": "Real Median Wage Decline",
+        "threshold": 5.0,
+        "early_threshold": 1.5,
+        "unit": "%",
+        "direction": "decline",
+        "weight": 0.09,
+        "frequency": "quarterly",
+        "rationale": (
+            "Real median weekly earnings grow ~0.5-1%/yr historically. "
+            "A 5% decline over 3 years during productivity growth would be "
+            "THE displacement outcome — the economy growing while workers "
+            "get poorer. The single most important metric for whether AI "
+            "is helping or hurting people."
+        ),
+    },
+    "info_jobs_per_grad": {
+        "label": "Knowledge Jobs per Graduate Decline",
+        "threshold": 20.0,
+        "early_threshold": 8.0,
+        "unit": "%",
+        "direction": "decline",
+        "weight": 0.07,
+        "frequency": "quarterly",
+        "rationale": (
+            "Information sector employment divided by college-educated "
+            "labor force. Directly measures whether the knowledge economy "
+            "is creating or destroying demand for graduates. Unlike wages "
+            "(which reflect survivors), this catches structural erosion: "
+            "fewer knowledge jobs chasing more graduates. A 20% decline "
+            "over 3 years would signal the knowledge economy is contracting "
+            "relative to the educated workforce — the demand-side "
+            "displacement signal that wage data misses entirely."
+        ),
+    },
+    "labor_share": {
+        "label": "Labor Share Decline",
+        "threshold": 5.0,
+        "early_threshold": 1.7,
+        "unit": "pp",
+        "direction": "decline",
+        "weight": 0.06,
+        "frequency": "quarterly",
+        "rationale": (
+            "Labor share declined ~5pp over 15 years (2000-2015). "
+            "5pp in 3 years = 5x the historical rate."
+        ),
+    },
+    # LABOUR MARKET HEALTH — the human cost metrics
+    "prime_age_epop": {
+        "label": "Prime-Age EPOP Decline",
+        "threshold": 3.0,
+        "early_threshold": 1.0,
+        "unit": "pp",
+        "direction": "decline",
+        "weight": 0.08,
+        "frequency": "quarterly",
+        "rationale": (
+            "Prime-age (25-54) employment-population ratio is ~80% "
+            "when healthy. A 3pp decline during GDP growth is the "
+            "signature of structural displacement — the economy "
+            "thriving while workers suffer. Cannot be gamed by "
+            "discouraged workers leaving the labour force."
+        ),
+    },
+    "quits_rate": {
+        "label": "Quits Rate Decline",
+        "threshold": 0.8,
+        "early_threshold": 0.3,
+        "unit": "pp",
+        "direction": "decline",
+        "weight": 0.07,
+        "frequency": "quarterly",
+        "rationale": (
+            "Workers quit when they're confident they can find "
+            "something better. A 0.8pp decline (from ~2.2% to ~1.4%) "
+            "in a growing economy means workers feel trapped — the "
+            "earliest sentiment indicator of labour market distress."
+        ),
+    },
+    "unemployment": {
+        "label": "College Unemployment Rise",
+        "threshold": 2.0,
+        "early_threshold": 0.7,
+        "unit": "pp",
+        "direction": "rise",
+        "weight": 0.07,
+        "frequency": "quarterly",
+        "rationale": (
+            "College-educated unemployment is typically 2-3%. "
+            "A 2pp rise (to 4-5%) would be structurally abnormal."
+        ),
+    },
+    # AI INVESTMENT SCALE — the cause indicators
+    "nvidia": {
+        "label": "NVIDIA Quarterly Revenue",
+        "threshold": 200000.0,  # $200B/quarter ($800B/yr)
+        "early_threshold": 67000.0,  # ~$67B/quarter
+        "unit": "$M",
+        "direction": "rise",
+        "weight": 0.08,
+        "frequency": "quarterly",
+        "metric_type": "level",  # Absolute level, not growth rate
+        "rationale": (
+            "$200B/quarter = ~$800B/yr from one AI chip company. "
+            "At that scale, AI compute spending is ~3-4% of US GDP. "
+            "Note: revenue measures compute spending, not deployment type — "
+            "the same hardware could power automation or augmentation."
+        ),
+    },
+    "it_equipment": {
+        "label": "IT Equipment Investment Growth",
+        "threshold": 30.0,
+        "early_threshold": 10.0,
+        "unit": "%",
+        "direction": "rise",
+        "weight": 0.06,
+        "frequency": "quarterly",
+        "rationale": (
+            "Real private investment in information processing equipment "
+            "grows ~3-5%/yr historically. 10%/yr sustained (30% over 3 years) "
+            "signals a structural shift toward capital-over-labor. Broader "
+            "than NVIDIA alone (captures all vendors). The hardware side "
+            "of AI capex."
+        ),
+    },
+    "software_investment": {
+        "label": "Software Investment Growth",
+        "threshold": 40.0,
+        "early_threshold": 15.0,
+        "unit": "%",
+        "direction": "rise",
+        "weight": 0.05,
+        "frequency": "quarterly",
+        "rationale": (
+            "Real private investment in software grows ~5-7%/yr historically. "
+            "~12%/yr sustained (40% over 3 years) signals massive capital "
+            "reallocation toward AI/software systems. Captures cloud AI, "
+            "enterprise platforms, SaaS tools — the software side of AI "
+            "capex that hardware metrics miss."
+        ),
+    },
+}
+
+CONSISTENCY_TARGET = 0.75
+
+# Scoring inputs: key used by compute_takeoff_metrics -> (processed subdir, quarter-end only)
+SCORING_SOURCES = {
+    "labor_share": ("labor_share", False),
+    "nvidia": ("nvidia_revenue", False),
+    "tfp": ("tfp", False),
+    "capital_labor": ("capital_labor", False),
+    "unemployment_q": ("graduate_unemployment_rate", True),
+    "occupation_q": ("occupation_employment", True),
+    "prime_age_epop_q": ("prime_age_epop", True),
+    "quits_rate_q": ("quits_rate", True),
+    "it_equipment": ("it_equipment_investment", False),
+    "median_wages": ("median_wages", False),
+    "info_jobs_per_grad_q": ("info_jobs_per_grad", True),
+    "software_investment": ("software_investment", False),
+}
+
+# Threshold key -> (scoring dataset key, column, use_absolute)
+METRIC_CONFIGS = {
+    "tfp": ("tfp", "tfp_index", False),
+    "occupation_gap": ("occupation_q", "displacement_gap", True),
+    "capital_labor": ("capital_labor", "capital_labor_ratio", False),
+    "median_wages": ("median_wages", "median_weekly_earnings", False),
+    "info_jobs_per_grad": ("info_jobs_per_grad_q", "info_jobs_per_grad", False),
+    "labor_share": ("labor_share", "labor_share_index", True),
+    "prime_age_epop": ("prime_age_epop_q", "prime_age_epop", True),
+    "quits_rate": ("quits_rate_q", "quits_rate", True),
+    "unemployment": ("unemployment_q", "graduate_unemployment_rate", True),
+    "nvidia": ("nvidia", "revenue_millions", False),
+    "it_equipment": ("it_equipment", "it_equipment_investment", False),
+    "software_investment": ("software_investment", "software_investment", False),
+}
+
+
+def read_processed(path: Path) -> pd.DataFrame:
+    """Read a processed dataset as date + float32 metrics, sorted by date.
+
+    Prefers the Parquet copy, which is stored in exactly this shape.
+    """
+    parquet_path = path.with_suffix(".parquet")
+    if parquet_path.exists():
+        df = pd.read_parquet(parquet_path, engine="pyarrow")
+    else:
+        # Charts and 3yr changes need nowhere near float64 precision; every
+        # column beyond year/month is numeric, so the parser can write
+        # straight into narrow typed buffers.
+        dtypes = defaultdict(lambda: "float32", year="int16", month="int16")
+        df = pd.read_csv(path, dtype=dtypes)
+        months_since_epoch = (df["year"].to_numpy() - 1970) * 12 + df["month"].to_numpy() - 1
+        df = df.drop(columns=["year", "month"])
+        df.insert(0, "date", months_since_epoch.astype("datetime64[M]").astype("datetime64[ns]"))
+    return df.sort_values("date", ignore_index=True)
+
+
+def read_manifest(data_dir: Path):
+    """Read the pipeline's manifest of available datasets, or None if it is missing."""
+    try:
+        return json.loads((data_dir / "manifest.json").read_text())
+    except FileNotFoundError:
+        return None
+
+
+def load_optional(data_dir: Path, subdir: str, filename: str, manifest=None):
+    """Load a processed dataset if it exists, return df or None."""
+    path = data_dir / subdir / filename
+    if manifest is not None:
+        if not manifest.get(subdir):
+            return None
+    elif not path.exists() and not path.with_suffix(".parquet").exists():
+        return None
+    try:
+        return read_processed(path)
+    except FileNotFoundError:
+        # A stale manifest entry for a removed dataset: skip it like a missing one
+        return None
+
+
+def align_to_quarterly(df):
+    """Convert date-sorted monthly data to quarterly (last month of each quarter)."""
+    # Months since 1970-01; quarter-end months (Mar/Jun/Sep/Dec) are 2 mod 3
+    months = df["date"].to_numpy().astype("datetime64[M]").astype("int64")
+    return df[months % 3 == 2].reset_index(drop=True)
+
+
+def compute_3yr_changes(series, frequencies, use_absolute):
+    """Compute 3-year changes for several date-sorted value arrays at once.
+
+    Handles quarterly (12 periods) and annual (3 periods) lookbacks. The last
+    13 values of each series are stacked into a NaN-padded matrix so every
+    change comes out of one vectorized pass. Returns NaN where the history is
+    too short or a percentage change has a zero base.
+    """
+    lookbacks = np.array([3 if f == "annual" else 12 for f in frequencies], dtype=int)
+    tails = np.full((len(series), 13), np.nan)
+    for row, values in zip(tails, series, strict=True):
+        tail = values[-13:]
+        row[13 - tail.size :] = tail
+
+    current = tails[:, -1]
+    past = tails[np.arange(len(series)), -(lookbacks + 1)]
+    diff = current - past
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(past == 0, np.nan, diff / past * 100)
+    return np.where(np.asarray(use_absolute, dtype=bool), diff, pct)
+
+
+def compute_consistency(df, col, direction="rise"):
+    """Fraction of period-over-period changes in the expected direction.
+
+    Expects df sorted by date, as returned by read_processed and align_to_quarterly.
+    """
+    assert df["date"].is_monotonic_increasing
+    if len(df) < 2:
+        return None
+
+    changes = df[col].diff().dropna()
+    if len(changes) == 0:
+        return None
+
+    if direction == "decline":
+        correct = (changes < 0).sum()
+    else:
+        correct = (changes > 0).sum()
+    return correct / len(changes)
+
+
+def compute_takeoff_metrics(datasets):
+    """Compute progress toward takeoff for each metric."""
+    results = {}
+
+    candidates = []
+    for key, (ds_key, col, use_abs) in METRIC_CONFIGS.items():
+        df = datasets.get(ds_key)
+        if df is None or len(df) == 0:
+            continue
+        if key not in TAKEOFF_THRESHOLDS:
+            continue
+
+        cons = compute_consistency(df, col, direction=TAKEOFF_THRESHOLDS[key]["direction"])
+        if cons is None:
+            continue
+        candidates.append((key, df[col].to_numpy(), use_abs, cons))
+
+    keys = [key for key, _, _, _ in candidates]
+    infos = [TAKEOFF_THRESHOLDS[key] for key in keys]
+
+    # Every metric's 3yr change in one batched pass
+    changes = compute_3yr_changes(
+        [values for _, values, _, _ in candidates],
+        [info["frequency"] for info in infos],
+        [use_abs for _, _, use_abs, _ in candidates],
+    )
+
+    # Level metrics measure progress as current value / threshold; change
+    # metrics as the 3yr change (sign-flipped for declines) / threshold
+    is_level = np.array(
+        [info.get("metric_type", "change") == "level" for info in infos], dtype=bool
+    )
+    signs = np.array([-1.0 if info["direction"] == "decline" else 1.0 for info in infos])
+    thresholds = np.array([info["threshold"] for info in infos], dtype=float)
+    consistency = np.array([cons for _, _, _, cons in candidates], dtype=float)
+    latest = np.array([values[-1] for _, values, _, _ in candidates], dtype=float)
+
+    raw_change = np.where(is_level, latest, changes)
+    effective = np.where(is_level, latest, signs * changes)
+    progress = np.maximum(0.0, effective / thresholds)
+    score = progress * consistency
+
+    # Change-based metrics without enough history are left out
+    for i in np.flatnonzero(is_level | ~np.isnan(changes)):
+        results[keys[i]] = {
+            "progress": progress[i],
+            "consistency": consistency[i],
+            "score": score[i],
+            "raw_change": raw_change[i],
+            "effective_change": effective[i],
+            "threshold": thresholds[i],
+        }
+
+    return results
+
+
+def compute_takeoff_score(metrics):
+    """Compute overall takeoff score (0-100)."""
+    if not metrics:
+        return 0.0
+
+    weights = np.array([TAKEOFF_THRESHOLDS[key]["weight"] for key in metrics])
+    scores = np.array([data["score"] for data in metrics.values()])
+
+    total_w = weights.sum()
+    if total_w == 0:
+        return 0.0
+
+    base = weights @ np.minimum(scores, 1.0) / total_w
+    active = np.count_nonzero(scores > 0.3)
+    coherence = 0.5 + 0.5 * (active / len(TAKEOFF_THRESHOLDS))
+    return float(min(100.0, base * coherence * 100))
+
+
+def load_scoring_data(data_dir: Path):
+    """Load the scoring inputs; monthly datasets use their quarter-end variants."""
+    manifest = read_manifest(data_dir)
+    datasets = {}
+    for key, (subdir, quarterly) in SCORING_SOURCES.items():
+        df = load_optional(data_dir, subdir, f"{subdir}_processed.csv", manifest)
+        if df is not None and quarterly:
+            df = align_to_quarterly(df)
+        datasets[key] = df
+    return datasets
@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = ("BABATOTALSAUS", "Monthly", "business_applications", "business_applications", 42)
+
 
 def build_fred_url(series_id, frequency="Monthly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -31,16 +35,14 @@ def fetch_business_applications_data():
 
     Reference: Acemoglu & Restrepo (2019) reinstatement effect.
     """
-    url = build_fred_url("BABATOTALSAUS", frequency="Monthly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="business_applications",
-        column_name="business_applications",
-        quarters=42,
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    analyze_trend(df_recent, "business_applications")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
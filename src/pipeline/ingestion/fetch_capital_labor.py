@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
@@ -6,7 +7,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import pandas as pd
-import requests
+from utils import get_session
 
 
 def build_fred_url(series_id: str, frequency: str = "Annual") -> str:
@@ -22,25 +23,28 @@ def build_fred_url(series_id: str, frequency: str = "Annual") -> str:
 
 def fetch_single_series(
     series_id: str, column_name: str, years: int = 15
-) -> pd.DataFrame:
-    """Fetch a single annual FRED series and return last N years."""
+) -> tuple[pd.DataFrame, list[str]]:
+    """Fetch a single annual FRED series and return last N years.
+
+    Progress messages are returned alongside the data rather than printed, so
+    concurrent downloads don't interleave their output.
+    """
     url = build_fred_url(series_id)
-    print(f"  Downloading {series_id}...")
+    messages = [f"  Downloading {series_id}..."]
 
-    response = requests.get(url, timeout=30)
+    response = get_session().get(url, timeout=30)
     response.raise_for_status()
 
-    df = pd.read_csv(StringIO(response.text))
+    df = pd.read_csv(StringIO(response.text), parse_dates=[0], na_values=".")
     df.columns = ["date", column_name]
-    df["date"] = pd.to_datetime(df["date"])
     df = df.dropna(subset=["date", column_name])
     df = df.tail(years).copy()
 
-    print(f"  • {column_name}: {len(df)} observations")
-    print(f"  • Range: {df['date'].min()} to {df['date'].max()}")
-    print(f"  • Latest: {df.iloc[-1][column_name]:.3f}")
+    messages.append(f"  • {column_name}: {len(df)} observations")
+    messages.append(f"  • Range: {df['date'].min()} to {df['date'].max()}")
+    messages.append(f"  • Latest: {df.iloc[-1][column_name]:.3f}")
 
-    return df
+    return df, messages
 
 
 def fetch_capital_labor_data() -> None:
@@ -57,8 +61,14 @@ def fetch_capital_labor_data() -> None:
 
     print("Fetching capital and labor input data...")
 
-    capital_df = fetch_single_series("MPU4910042", "capital_input", years=15)
-    labor_df = fetch_single_series("MPU4910052", "labor_input", years=15)
+    # Both series download concurrently over the shared session; each
+    # worker's messages are printed whole, here in the main thread
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        capital = pool.submit(fetch_single_series, "MPU4910042", "capital_input", years=15)
+        labor = pool.submit(fetch_single_series, "MPU4910052", "labor_input", years=15)
+        for future in as_completed([capital, labor]):
+            print("\n".join(future.result()[1]))
+        capital_df, labor_df = capital.result()[0], labor.result()[0]
 
     # Merge on date
     merged = pd.merge(capital_df, labor_df, on="date", how="inner")
@@ -67,12 +77,12 @@ def fetch_capital_labor_data() -> None:
     )
 
     print("\nCapital-to-Labor Ratio:")
-    for _, row in merged.iterrows():
-        print(
-            f"  • {row['date'].strftime('%Y')}: "
-            f"{row['capital_labor_ratio']:.4f} "
-            f"(C={row['capital_input']:.1f}, L={row['labor_input']:.1f})"
-        )
+    years = merged["date"].dt.year.astype(str)
+    ratio = merged["capital_labor_ratio"].map("{:.4f}".format)
+    capital = merged["capital_input"].map("{:.1f}".format)
+    labor = merged["labor_input"].map("{:.1f}".format)
+    lines = "  • " + years + ": " + ratio + " (C=" + capital + ", L=" + labor + ")"
+    print("\n".join(lines))
 
     output_path = data_dir / "capital_labor_ratio.csv"
     merged.to_csv(output_path, index=False)
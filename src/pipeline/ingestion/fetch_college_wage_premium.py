@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
@@ -6,7 +7,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import pandas as pd
-import requests
+from utils import get_session
 
 
 def build_fred_url(series_id: str, frequency: str = "Quarterly") -> str:
@@ -22,25 +23,28 @@ def build_fred_url(series_id: str, frequency: str = "Quarterly") -> str:
 
 def fetch_single_series(
     series_id: str, column_name: str, quarters: int = 14
-) -> pd.DataFrame:
-    """Fetch a single quarterly FRED series and return last N quarters."""
+) -> tuple[pd.DataFrame, list[str]]:
+    """Fetch a single quarterly FRED series and return last N quarters.
+
+    Progress messages are returned alongside the data rather than printed, so
+    concurrent downloads don't interleave their output.
+    """
     url = build_fred_url(series_id)
-    print(f"  Downloading {series_id}...")
+    messages = [f"  Downloading {series_id}..."]
 
-    response = requests.get(url, timeout=30)
+    response = get_session().get(url, timeout=30)
     response.raise_for_status()
 
-    df = pd.read_csv(StringIO(response.text))
+    df = pd.read_csv(StringIO(response.text), parse_dates=[0], na_values=".")
     df.columns = ["date", column_name]
-    df["date"] = pd.to_datetime(df["date"])
     df = df.dropna(subset=["date", column_name])
     df = df.tail(quarters).copy()
 
-    print(f"  * {column_name}: {len(df)} observations")
-    print(f"  * Range: {df['date'].min()} to {df['date'].max()}")
-    print(f"  * Latest: {df.iloc[-1][column_name]:.1f}")
+    messages.append(f"  * {column_name}: {len(df)} observations")
+    messages.append(f"  * Range: {df['date'].min()} to {df['date'].max()}")
+    messages.append(f"  * Latest: {df.iloc[-1][column_name]:.1f}")
 
-    return df
+    return df, messages
 
 
 def fetch_college_wage_premium_data() -> None:
@@ -69,12 +73,18 @@ def fetch_college_wage_premium_data() -> None:
 
     print("Fetching college wage premium data...")
 
-    bachelor_df = fetch_single_series(
-        "LEU0252918300Q", "bachelor_earnings", quarters=14
-    )
-    highschool_df = fetch_single_series(
-        "LEU0252884000Q", "highschool_earnings", quarters=14
-    )
+    # Both series download concurrently over the shared session; each
+    # worker's messages are printed whole, here in the main thread
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        bachelor = pool.submit(
+            fetch_single_series, "LEU0252918300Q", "bachelor_earnings", quarters=14
+        )
+        highschool = pool.submit(
+            fetch_single_series, "LEU0252884000Q", "highschool_earnings", quarters=14
+        )
+        for future in as_completed([bachelor, highschool]):
+            print("\n".join(future.result()[1]))
+        bachelor_df, highschool_df = bachelor.result()[0], highschool.result()[0]
 
     # Merge on date
     merged = pd.merge(bachelor_df, highschool_df, on="date", how="inner")
@@ -83,13 +93,14 @@ def fetch_college_wage_premium_data() -> None:
     )
 
     print("\nCollege Wage Premium (Bachelor's+ / HS-only):")
-    for _, row in merged.iterrows():
-        print(
-            f"  * {row['date'].strftime('%Y-Q%q')}: "
-            f"{row['college_wage_premium']:.3f}x "
-            f"(BA=${row['bachelor_earnings']:.0f}, "
-            f"HS=${row['highschool_earnings']:.0f})"
-        )
+    # strftime has no quarter directive, so build "YYYY-Qn" from the parts
+    dates = merged["date"].dt
+    labels = dates.year.astype(str) + "-Q" + dates.quarter.astype(str)
+    premium = merged["college_wage_premium"].map("{:.3f}x".format)
+    bachelor = merged["bachelor_earnings"].map("{:.0f}".format)
+    highschool = merged["highschool_earnings"].map("{:.0f}".format)
+    lines = "  * " + labels + ": " + premium + " (BA=$" + bachelor + ", HS=$" + highschool + ")"
+    print("\n".join(lines))
 
     output_path = data_dir / "college_wage_premium.csv"
     merged.to_csv(output_path, index=False)
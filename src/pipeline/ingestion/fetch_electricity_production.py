@@ -1,4 +1,3 @@
-from io import StringIO
 from pathlib import Path
 
 import pandas as pd
@@ -22,24 +21,32 @@ def fetch_electricity_consumption() -> None:
 
     print("Downloading electricity consumption data from EIA...")
 
-    response = requests.get(EIA_URL, timeout=30)
-    response.raise_for_status()
-
-    df = pd.read_csv(StringIO(response.text))
-
-    # Filter for total retail sales
-    total = df[df["MSN"] == TARGET_MSN].copy()
-
-    # Keep only monthly rows (YYYYMM where MM != 13; 13 = annual total)
-    total["period"] = total["YYYYMM"].astype(str)
-    monthly = total[~total["period"].str.endswith("13")].copy()
-    monthly = monthly[monthly["Value"] != "Not Available"]
+    # Parse the table straight off the socket, keeping only the columns used
+    # below, and filter for total retail sales chunk by chunk so the rest of
+    # the multi-series file is never held in memory
+    with requests.get(EIA_URL, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        chunks = pd.read_csv(
+            response.raw,
+            usecols=["MSN", "YYYYMM", "Value"],
+            dtype={"MSN": str, "YYYYMM": "int32", "Value": str},
+            chunksize=100_000,
+        )
+        total = pd.concat(
+            [chunk[chunk["MSN"] == TARGET_MSN] for chunk in chunks], ignore_index=True
+        )
+
+    # Keep only monthly rows (YYYYMM where MM != 13; 13 = annual total) that
+    # carry a value, combining both tests into one mask so the frame is only
+    # sliced and copied once
+    is_monthly = total["YYYYMM"].to_numpy() % 100 != 13
+    keep = is_monthly & (total["Value"].to_numpy() != "Not Available")
+    monthly = total[keep].copy()
     monthly["Value"] = pd.to_numeric(monthly["Value"])
 
-    # Parse YYYYMM into date
-    monthly["date"] = pd.to_datetime(
-        monthly["YYYYMM"].astype(str), format="%Y%m"
-    )
+    # Parse YYYYMM into date in one strict pass
+    monthly["date"] = pd.to_datetime(monthly["YYYYMM"].astype(str), format="%Y%m")
     monthly = monthly.sort_values("date").reset_index(drop=True)
 
     # Keep last 42 months
@@ -56,8 +63,9 @@ def fetch_electricity_consumption() -> None:
         f"million kWh ({result.iloc[-1]['date'].strftime('%Y-%m')})"
     )
 
-    output_path = data_dir / "electricity_consumption_last_42_months.csv"
-    result.to_csv(output_path, index=False)
+    # Parquet keeps the parsed date and float dtypes for the processing step
+    output_path = data_dir / "electricity_consumption_last_42_months.parquet"
+    result.to_parquet(output_path, engine="pyarrow", compression="zstd", index=False)
     print(f"\n✓ Saved to {output_path}")
 
 
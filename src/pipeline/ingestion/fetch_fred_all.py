@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import fetch_business_applications
+import fetch_it_equipment_investment
+import fetch_labor_share
+import fetch_median_wages
+import fetch_prime_age_epop
+import fetch_quits_rate
+import fetch_real_gdp_per_capita
+import fetch_software_investment
+import fetch_tfp
+import fetch_unemployment_rate
+from utils import analyze_trend, fetch_fred_data_many
+
+# Single-series fetch scripts; each one's FRED_SPEC and build_fred_url stay the
+# source of truth for its series, this module only downloads them together
+FRED_MODULES = [
+    fetch_labor_share,
+    fetch_real_gdp_per_capita,
+    fetch_unemployment_rate,
+    fetch_tfp,
+    fetch_business_applications,
+    fetch_prime_age_epop,
+    fetch_quits_rate,
+    fetch_it_equipment_investment,
+    fetch_median_wages,
+    fetch_software_investment,
+]
+
+
+def fetch_fred_all() -> dict:
+    """Fetch every single-series FRED dataset concurrently.
+
+    Equivalent to running each fetch_<dataset>.py script in turn, but the
+    downloads overlap, so the wall time is close to the slowest series rather
+    than the sum of all of them.
+    """
+    specs = []
+    for module in FRED_MODULES:
+        series_id, frequency, data_name, column_name, quarters = module.FRED_SPEC
+        url = module.build_fred_url(series_id, frequency=frequency)
+        specs.append((url, data_name, column_name, quarters))
+    results = fetch_fred_data_many(specs)
+
+    # A failed series has already been reported; analyze the ones that arrived
+    for _, data_name, column_name, _ in specs:
+        if data_name in results:
+            print(f"\n{data_name}:")
+            analyze_trend(results[data_name], column_name)
+
+    return results
+
+
+if __name__ == "__main__":
+    fetch_fred_all()
@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
@@ -6,7 +7,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import pandas as pd
-import requests
+from utils import get_session
 
 
 def build_fred_url(series_id: str, frequency: str = "Monthly") -> str:
@@ -22,26 +23,28 @@ def build_fred_url(series_id: str, frequency: str = "Monthly") -> str:
 
 def fetch_single_series(
     series_id: str, column_name: str, months: int = 42
-) -> pd.DataFrame:
-    """Fetch a single monthly FRED series and return last N months."""
+) -> tuple[pd.DataFrame, list[str]]:
+    """Fetch a single monthly FRED series and return last N months.
+
+    Progress messages are returned alongside the data rather than printed, so
+    concurrent downloads don't interleave their output.
+    """
     url = build_fred_url(series_id)
-    print(f"  Downloading {series_id}...")
+    messages = [f"  Downloading {series_id}..."]
 
-    response = requests.get(url, timeout=30)
+    response = get_session().get(url, timeout=30)
     response.raise_for_status()
 
-    df = pd.read_csv(StringIO(response.text))
+    df = pd.read_csv(StringIO(response.text), parse_dates=[0], na_values=".")
     df.columns = ["date", column_name]
-    df["date"] = pd.to_datetime(df["date"])
-    df[column_name] = pd.to_numeric(df[column_name], errors="coerce")
     df = df.dropna(subset=["date", column_name])
     df = df.tail(months).copy()
 
-    print(f"  * {column_name}: {len(df)} observations")
-    print(f"  * Range: {df['date'].min()} to {df['date'].max()}")
-    print(f"  * Latest: {df.iloc[-1][column_name]:,.1f}")
+    messages.append(f"  * {column_name}: {len(df)} observations")
+    messages.append(f"  * Range: {df['date'].min()} to {df['date'].max()}")
+    messages.append(f"  * Latest: {df.iloc[-1][column_name]:,.1f}")
 
-    return df
+    return df, messages
 
 
 def fetch_info_jobs_per_grad_data() -> None:
@@ -69,8 +72,14 @@ def fetch_info_jobs_per_grad_data() -> None:
 
     print("Fetching information sector jobs per graduate data...")
 
-    info_df = fetch_single_series("USINFO", "info_employment", months=42)
-    grad_df = fetch_single_series("LNS11027662", "college_labor_force", months=42)
+    # Both series download concurrently over the shared session; each
+    # worker's messages are printed whole, here in the main thread
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        info = pool.submit(fetch_single_series, "USINFO", "info_employment", months=42)
+        grad = pool.submit(fetch_single_series, "LNS11027662", "college_labor_force", months=42)
+        for future in as_completed([info, grad]):
+            print("\n".join(future.result()[1]))
+        info_df, grad_df = info.result()[0], grad.result()[0]
 
     # Merge on date
     merged = pd.merge(info_df, grad_df, on="date", how="inner")
@@ -79,13 +88,13 @@ def fetch_info_jobs_per_grad_data() -> None:
     )
 
     print("\nInformation Sector Jobs per 100 Graduates:")
-    for _, row in merged.tail(14).iterrows():
-        print(
-            f"  * {row['date'].strftime('%Y-%m')}: "
-            f"{row['info_jobs_per_grad']:.2f} "
-            f"(Info={row['info_employment']:,.0f}k, "
-            f"Grads={row['college_labor_force']:,.0f}k)"
-        )
+    recent = merged.tail(14)
+    months = recent["date"].dt.strftime("%Y-%m")
+    ratio = recent["info_jobs_per_grad"].map("{:.2f}".format)
+    info = recent["info_employment"].map("{:,.0f}".format)
+    grads = recent["college_labor_force"].map("{:,.0f}".format)
+    lines = "  * " + months + ": " + ratio + " (Info=" + info + "k, Grads=" + grads + "k)"
+    print("\n".join(lines))
 
     # Trend
     first = merged["info_jobs_per_grad"].iloc[0]
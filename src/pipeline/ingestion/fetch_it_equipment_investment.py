@@ -5,6 +5,16 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = (
+    "Y033RC1Q027SBEA",
+    "Quarterly",
+    "it_equipment_investment",
+    "it_equipment_investment",
+    14,
+)
+
 
 def build_fred_url(series_id, frequency="Quarterly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -34,16 +44,14 @@ def fetch_it_equipment_investment_data():
     AI efficiency improves. Sustained acceleration above the historical
     ~3-5%/yr trend signals structural shift toward capital-over-labor.
     """
-    url = build_fred_url("Y033RC1Q027SBEA", frequency="Quarterly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="it_equipment_investment",
-        column_name="it_equipment_investment",
-        quarters=14,
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    analyze_trend(df_recent, "it_equipment_investment")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = ("PRS85006173", "Quarterly", "labor_share", "labor_share_index", 14)
+
 
 def build_fred_url(series_id, frequency="Quarterly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -19,15 +23,14 @@ def build_fred_url(series_id, frequency="Quarterly"):
 
 def fetch_labor_share_data():
     """Fetch labor share of income data from FRED and save to data directory."""
-    url = build_fred_url("PRS85006173", frequency="Quarterly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
-    # Fetch data using utility
     df_recent = fetch_fred_data(
-        url=url, data_name="labor_share", column_name="labor_share_index", quarters=14
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    # Analyze trends
-    analyze_trend(df_recent, "labor_share_index")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = ("LES1252881600Q", "Quarterly", "median_wages", "median_weekly_earnings", 14)
+
 
 def build_fred_url(series_id, frequency="Quarterly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -34,16 +38,14 @@ def fetch_median_wages_data():
     Historical growth: ~0.5-1%/yr. A sustained decline during
     productivity growth would be historically unprecedented.
     """
-    url = build_fred_url("LES1252881600Q", frequency="Quarterly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="median_wages",
-        column_name="median_weekly_earnings",
-        quarters=14,
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    analyze_trend(df_recent, "median_weekly_earnings")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
@@ -1,8 +1,13 @@
+import sys
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 import pandas as pd
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils import get_session
+
 NVIDIA_CIK = "0001045810"
 SEC_EDGAR_URL = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{NVIDIA_CIK}.json"
 
@@ -13,6 +18,23 @@ SEC_HEADERS = {
 }
 
 
+def edgar_unchanged_since(path: Path) -> bool:
+    """Check whether NVIDIA's EDGAR company facts are no newer than a saved file.
+
+    A HEAD request reads Last-Modified without downloading the multi-megabyte
+    JSON. It goes through the shared session, so it reuses the connection for
+    the follow-up GET and is retried when EDGAR rate-limits. Any failure or
+    missing header counts as changed.
+    """
+    try:
+        response = get_session().head(SEC_EDGAR_URL, headers=SEC_HEADERS, timeout=10)
+        response.raise_for_status()
+        last_modified = parsedate_to_datetime(response.headers["Last-Modified"])
+    except (requests.RequestException, KeyError, TypeError, ValueError):
+        return False
+    return last_modified.timestamp() <= path.stat().st_mtime
+
+
 def fetch_nvidia_revenue():
     """Fetch NVIDIA quarterly revenue from SEC EDGAR XBRL API.
 
@@ -25,9 +47,13 @@ def fetch_nvidia_revenue():
     data_dir.mkdir(parents=True, exist_ok=True)
     output_path = data_dir / "nvidia_quarterly_revenue.csv"
 
+    if output_path.exists() and edgar_unchanged_since(output_path):
+        print(f"✓ No new SEC EDGAR filings since last fetch, using {output_path}")
+        return pd.read_csv(output_path, parse_dates=["date"])
+
     print("Downloading NVIDIA financial data from SEC EDGAR...")
 
-    response = requests.get(SEC_EDGAR_URL, headers=SEC_HEADERS, timeout=30)
+    response = get_session().get(SEC_EDGAR_URL, headers=SEC_HEADERS, timeout=30)
     response.raise_for_status()
 
     facts = response.json()
@@ -52,7 +78,12 @@ def fetch_nvidia_revenue():
     annual = {}  # 363-day periods (full year)
     nine_month = {}  # 272-day periods (3 quarters cumulative)
 
-    for entry in usd_data:
+    # Parse every entry's ISO period bounds in one vectorized pass rather than
+    # one pd.to_datetime call per entry; missing bounds become NaT
+    starts = pd.to_datetime([e.get("start") for e in usd_data], format="%Y-%m-%d")
+    ends = pd.to_datetime([e.get("end") for e in usd_data], format="%Y-%m-%d")
+
+    for entry, start_date, end_date in zip(usd_data, starts, ends, strict=True):
         start = entry.get("start")
         end = entry.get("end")
         val = entry.get("val")
@@ -63,11 +94,9 @@ def fetch_nvidia_revenue():
         if form not in ("10-Q", "10-K"):
             continue
 
-        start_date = pd.to_datetime(start)
-        end_date = pd.to_datetime(end)
         period_days = (end_date - start_date).days
 
-        key = end_date.strftime("%Y-%m-%d")
+        key = end
 
         if 80 <= period_days <= 100:
             quarterly[key] = {
@@ -105,15 +134,17 @@ def fetch_nvidia_revenue():
         print("  ⚠ No quarterly revenue records found")
         return None
 
-    df = pd.DataFrame(list(quarterly.values()))
-    df = df.sort_values("period_end").reset_index(drop=True)
-
-    # Keep last 14 quarters
-    df = df.tail(14).reset_index(drop=True)
+    # Keys are ISO end dates, so sorting them orders the quarters; keep the
+    # last 14 and build the frame once, already in order
+    recent = [quarterly[key] for key in sorted(quarterly)[-14:]]
 
-    # Add date column for consistency with other pipeline scripts
-    df["date"] = df["period_end"]
-    df = df[["date", "revenue_millions"]]
+    # Name the date column for consistency with other pipeline scripts
+    df = pd.DataFrame(
+        {
+            "date": [q["period_end"] for q in recent],
+            "revenue_millions": [q["revenue_millions"] for q in recent],
+        }
+    )
 
     print("\nData Summary:")
     print(f"  • Quarters found: {len(df)}")
@@ -121,8 +152,9 @@ def fetch_nvidia_revenue():
     print(f"  • Latest revenue: ${df.iloc[-1]['revenue_millions']:,.0f}M")
 
     print("\nQuarterly Revenue:")
-    for _, row in df.iterrows():
-        print(f"  • {row['date'].strftime('%Y-%m-%d')}: ${row['revenue_millions']:,.0f}M")
+    dates = df["date"].dt.strftime("%Y-%m-%d")
+    revenue = df["revenue_millions"].map("${:,.0f}M".format)
+    print("\n".join("  • " + dates + ": " + revenue))
 
     df.to_csv(output_path, index=False)
     print(f"\n✓ Saved to {output_path}")
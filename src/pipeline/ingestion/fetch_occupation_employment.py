@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
@@ -6,7 +7,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import pandas as pd
-import requests
+from utils import get_session
+
+# Concurrent FRED downloads; matches the shared session's connection pool
+MAX_WORKERS = 4
 
 # FRED series for occupation/industry employment (thousands)
 # CPS occupation groups (LNU02032xxx) = household survey, by occupation
@@ -44,37 +48,35 @@ def build_fred_url(series_id: str) -> str:
     )
 
 
-def fetch_series(series_id: str, name: str) -> pd.DataFrame | None:
-    """Fetch a single FRED series and return as DataFrame."""
+def fetch_series(series_id: str, name: str) -> tuple[pd.DataFrame | None, str]:
+    """Fetch a single FRED series and return it as a DataFrame with a status line.
+
+    The status line is returned rather than printed, so concurrent downloads
+    don't interleave their output.
+    """
     url = build_fred_url(series_id)
     try:
-        resp = requests.get(url, timeout=15)
+        resp = get_session().get(url, timeout=15)
         resp.raise_for_status()
 
         if "<!DOCTYPE" in resp.text[:100]:
-            print(f"  ⚠ {series_id} ({name}): series not found on FRED")
-            return None
+            return None, f"  ⚠ {series_id} ({name}): series not found on FRED"
 
-        df = pd.read_csv(StringIO(resp.text))
+        df = pd.read_csv(StringIO(resp.text), parse_dates=[0], na_values=".")
         df.columns = ["date", "employment"]
-        df["date"] = pd.to_datetime(df["date"])
-        df["employment"] = pd.to_numeric(df["employment"], errors="coerce")
         df = df.dropna()
 
         if len(df) == 0:
-            print(f"  ⚠ {series_id} ({name}): no data")
-            return None
+            return None, f"  ⚠ {series_id} ({name}): no data"
 
-        print(
+        return df, (
             f"  • {name}: {df['employment'].iloc[0]:.0f}k → "
             f"{df['employment'].iloc[-1]:.0f}k "
             f"({len(df)} months)"
         )
-        return df
 
     except Exception as e:
-        print(f"  ⚠ {series_id} ({name}): {e}")
-        return None
+        return None, f"  ⚠ {series_id} ({name}): {e}"
 
 
 def fetch_occupation_employment() -> None:
@@ -91,18 +93,30 @@ def fetch_occupation_employment() -> None:
     data_dir = Path("data/raw/occupation_employment")
     data_dir.mkdir(parents=True, exist_ok=True)
 
+    # The series are independent, so download them all concurrently. Status
+    # lines are printed afterwards, grouped and in series order, so each
+    # demographic correction still sits under the series it applies to
+    all_series = {**AI_TARGETABLE_SERIES, **NON_AUTOMATABLE_SERIES}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {
+            sid: pool.submit(fetch_series, sid, name) for sid, (name, _weight) in all_series.items()
+        }
+        fetched = {sid: future.result() for sid, future in futures.items()}
+
     print("Fetching AI-targetable occupation employment...")
     ai_dfs = []
-    for sid, (name, _weight) in AI_TARGETABLE_SERIES.items():
-        df = fetch_series(sid, name)
+    for sid in AI_TARGETABLE_SERIES:
+        df, status = fetched[sid]
+        print(status)
         if df is not None:
             ai_dfs.append(df.rename(columns={"employment": sid}))
 
     print("\nFetching non-automatable occupation employment...")
     non_dfs = []
     non_weights = {}
-    for sid, (name, weight) in NON_AUTOMATABLE_SERIES.items():
-        df = fetch_series(sid, name)
+    for sid, (_name, weight) in NON_AUTOMATABLE_SERIES.items():
+        df, status = fetched[sid]
+        print(status)
         if df is not None:
             non_dfs.append(df.rename(columns={"employment": sid}))
             non_weights[sid] = weight
@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = ("LNS12300060", "Monthly", "prime_age_epop", "prime_age_epop", 42)
+
 
 def build_fred_url(series_id, frequency="Monthly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -32,16 +36,14 @@ def fetch_prime_age_epop_data():
     the signature of structural displacement — the economy thriving
     while workers suffer.
     """
-    url = build_fred_url("LNS12300060", frequency="Monthly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="prime_age_epop",
-        column_name="prime_age_epop",
-        quarters=42,
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    analyze_trend(df_recent, "prime_age_epop")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = ("JTSQUR", "Monthly", "quits_rate", "quits_rate", 42)
+
 
 def build_fred_url(series_id, frequency="Monthly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -33,16 +37,14 @@ def fetch_quits_rate_data():
     A sustained decline to ~1.4% would signal severe structural
     distress — below even the 2008-2009 trough.
     """
-    url = build_fred_url("JTSQUR", frequency="Monthly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="quits_rate",
-        column_name="quits_rate",
-        quarters=42,
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    analyze_trend(df_recent, "quits_rate")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
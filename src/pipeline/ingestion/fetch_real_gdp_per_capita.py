@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = ("A939RX0Q048SBEA", "Quarterly", "real_gdp_per_capita", "real_gdp_per_capita", 14)
+
 
 def build_fred_url(series_id, frequency="Quarterly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -19,15 +23,14 @@ def build_fred_url(series_id, frequency="Quarterly"):
 
 def fetch_real_gdp_per_capita_data():
     """Fetch real GDP per capita data from FRED and save to data directory."""
-    url = build_fred_url("A939RX0Q048SBEA", frequency="Quarterly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
-    # Fetch data using utility
     df_recent = fetch_fred_data(
-        url=url, data_name="real_gdp_per_capita", column_name="real_gdp_per_capita", quarters=14
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    # Analyze trends
-    analyze_trend(df_recent, "real_gdp_per_capita")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too
+FRED_SPEC = ("B985RC1Q027SBEA", "Quarterly", "software_investment", "software_investment", 14)
+
 
 def build_fred_url(series_id, frequency="Quarterly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -34,16 +38,14 @@ def fetch_software_investment_data():
     would signal the economy is structurally shifting spend toward
     AI/information systems.
     """
-    url = build_fred_url("B985RC1Q027SBEA", frequency="Quarterly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="software_investment",
-        column_name="software_investment",
-        quarters=14,
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    analyze_trend(df_recent, "software_investment")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
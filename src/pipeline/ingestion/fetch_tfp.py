@@ -5,6 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too. 15 years of annual data
+FRED_SPEC = ("MFPNFBS", "Annual", "tfp", "tfp_index", 15)
+
 
 def build_fred_url(series_id: str, frequency: str = "Annual") -> str:
     """Build a FRED CSV download URL with dynamic dates."""
@@ -24,16 +28,14 @@ def fetch_tfp_data() -> None:
     Annual index (2017=100). The smoking gun for AI takeoff — rising TFP
     with declining labor input means more output from less human work.
     """
-    url = build_fred_url("MFPNFBS", frequency="Annual")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="tfp",
-        column_name="tfp_index",
-        quarters=15,  # 15 years of annual data
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    analyze_trend(df_recent, "tfp_index")
+    analyze_trend(df_recent, column_name)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,16 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from utils import analyze_trend, fetch_fred_data
 
+# (series_id, frequency, data_name, column_name, quarters) for this dataset;
+# fetch_fred_all.py reads it too. 42 months for 3.5 years of monthly data
+FRED_SPEC = (
+    "LNU04027662",
+    "Monthly",
+    "graduate_unemployment_rate",
+    "graduate_unemployment_rate",
+    42,
+)
+
 
 def build_fred_url(series_id, frequency="Monthly"):
     """Build a FRED CSV download URL with dynamic dates."""
@@ -23,18 +33,14 @@ def fetch_graduate_unemployment_rate_data():
     Uses LNU04027662 (Bachelor's Degree and Higher, 25+) instead of CGAD2534
     (Advanced Degree, 25-34) for much larger sample size and lower noise.
     """
-    url = build_fred_url("LNU04027662", frequency="Monthly")
+    series_id, frequency, data_name, column_name, quarters = FRED_SPEC
+    url = build_fred_url(series_id, frequency=frequency)
 
-    # Fetch data using utility (42 months for 3.5 years of monthly data)
     df_recent = fetch_fred_data(
-        url=url,
-        data_name="graduate_unemployment_rate",
-        column_name="graduate_unemployment_rate",
-        quarters=42,
+        url=url, data_name=data_name, column_name=column_name, quarters=quarters
     )
 
-    # Analyze trends
-    analyze_trend(df_recent, "graduate_unemployment_rate")
+    analyze_trend(df_recent, column_name)
 
     return df_recent
 
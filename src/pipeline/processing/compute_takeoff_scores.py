@@ -0,0 +1,31 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "dashboard"))
+from scoring import compute_takeoff_metrics, compute_takeoff_score, load_scoring_data
+
+
+def compute_takeoff_scores() -> None:
+    """Score every takeoff metric from the processed data and save the results as JSON.
+
+    The dashboard renders these precomputed scores directly, so none of the
+    quarterly alignment or 3-year change maths runs on page loads.
+    """
+    processed_dir = Path("data/processed")
+    metrics = compute_takeoff_metrics(load_scoring_data(processed_dir))
+    payload = {
+        "score": compute_takeoff_score(metrics),
+        "metrics": {
+            key: {name: float(value) for name, value in values.items()}
+            for key, values in metrics.items()
+        },
+    }
+
+    output_path = processed_dir / "takeoff_scores.json"
+    output_path.write_text(json.dumps(payload, indent=2) + "\n")
+    print(f"✓ {output_path} (score {payload['score']:.1f}, {len(metrics)} metrics)")
+
+
+if __name__ == "__main__":
+    compute_takeoff_scores()
@@ -0,0 +1,71 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# year/month are read as int16; every other processed column is numeric
+CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(column_types={"year": pa.int16(), "month": pa.int16()})
+
+
+def csv_to_parquet_table(csv_path: Path) -> pa.Table:
+    """Read a processed CSV into an Arrow table of date + float32 metrics.
+
+    The table never passes through pandas: Arrow's multi-threaded CSV reader
+    parses straight into typed columns and the Parquet writer takes them as-is.
+    """
+    table = pa_csv.read_csv(csv_path, convert_options=CSV_CONVERT_OPTIONS)
+    year = table["year"].to_numpy().astype(np.int64)
+    month = table["month"].to_numpy().astype(np.int64)
+    months_since_epoch = (year - 1970) * 12 + month - 1
+    date = months_since_epoch.astype("datetime64[M]").astype("datetime64[ns]")
+
+    metrics = table.drop_columns(["year", "month"])
+    # safe=False: narrowing float64 -> float32 drops precision by design
+    metrics = metrics.cast(
+        pa.schema([pa.field(name, pa.float32()) for name in metrics.column_names]), safe=False
+    )
+    return metrics.add_column(0, "date", pa.array(date))
+
+
+def convert_csv(csv_path: Path) -> str:
+    """Write the Parquet copy of one processed CSV and return a progress line."""
+    table = csv_to_parquet_table(csv_path)
+    output_path = csv_path.with_suffix(".parquet")
+    pq.write_table(table, output_path, compression="zstd")
+    return f"✓ {csv_path.name} → {output_path.name} ({table.num_rows} records)"
+
+
+def convert_processed_to_parquet() -> None:
+    """Write a typed Parquet copy of every processed CSV.
+
+    Year/month are replaced by a materialized date column and the metrics are
+    stored as float32, so the dashboard reads these copies as-is, skipping CSV
+    parsing, the year/month -> date assembly and any dtype narrowing. A manifest of
+    the available datasets is written alongside so the dashboard can skip
+    per-dataset existence checks.
+    """
+    processed_dir = Path("data/processed")
+    csv_files = sorted(processed_dir.glob("*/*_processed.csv"))
+
+    if not csv_files:
+        print("No processed CSV files found")
+        return
+
+    # Files are independent and Arrow releases the GIL while parsing and
+    # writing, so threads convert them in parallel without process start-up
+    with ThreadPoolExecutor() as pool:
+        for line in pool.map(convert_csv, csv_files):
+            print(line)
+
+    manifest = {csv_path.parent.name: True for csv_path in csv_files}
+    manifest_path = processed_dir / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n")
+    print(f"✓ {manifest_path} ({len(manifest)} datasets)")
+
+
+if __name__ == "__main__":
+    convert_processed_to_parquet()
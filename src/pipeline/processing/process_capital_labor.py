@@ -1,7 +1,11 @@
+import sys
 from pathlib import Path
 
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils import split_date_column, write_processed
+
 
 def process_capital_labor() -> None:
     """Process capital-labor ratio data: split date into year/month."""
@@ -23,18 +27,10 @@ def process_capital_labor() -> None:
         print("  ⚠ No 'date' column found")
         return
 
-    df["date"] = pd.to_datetime(df["date"])
-    df["year"] = df["date"].dt.strftime("%Y")
-    df["month"] = df["date"].dt.strftime("%m")
-    df = df.drop("date", axis=1)
-
-    cols = ["year", "month"] + [
-        c for c in df.columns if c not in ["year", "month"]
-    ]
-    df = df[cols]
+    df = split_date_column(df)
 
     output_path = processed_dir / "capital_labor_processed.csv"
-    df.to_csv(output_path, index=False)
+    write_processed(df, output_path)
     print(f"✓ Processed data saved to {output_path}")
     print(df.to_string(index=False))
 
@@ -1,7 +1,11 @@
+import sys
 from pathlib import Path
 
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils import split_date_column, write_processed
+
 
 def process_info_jobs_per_grad():
     """Process info jobs per grad data by splitting date into year and month columns."""
@@ -23,27 +27,19 @@ def process_info_jobs_per_grad():
     print(f"  * Columns: {list(df.columns)}")
 
     if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"])
-
-        df["year"] = df["date"].dt.strftime("%Y")
-        df["month"] = df["date"].dt.strftime("%m")
-
-        df = df.drop("date", axis=1)
-
-        cols = ["year", "month"] + [col for col in df.columns if col not in ["year", "month"]]
-        df = df[cols]
+        df = split_date_column(df)
 
         print("  * Split date into year/month columns")
         print(
-            f"  * Date range: {df['year'].min()}-{df['month'].min()} "
-            f"to {df['year'].max()}-{df['month'].max()}"
+            f"  * Date range: {df['year'].min()}-{df['month'].min():02d} "
+            f"to {df['year'].max()}-{df['month'].max():02d}"
         )
     else:
         print("  ! No 'date' column found")
         return
 
     output_path = processed_dir / "info_jobs_per_grad_processed.csv"
-    df.to_csv(output_path, index=False)
+    write_processed(df, output_path)
 
     print(f"Processed data saved to {output_path}")
     print(f"  * Final columns: {list(df.columns)}")
@@ -1,7 +1,11 @@
+import sys
 from pathlib import Path
 
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils import split_date_column, write_processed
+
 
 def process_nvidia_revenue():
     """
@@ -27,25 +31,14 @@ def process_nvidia_revenue():
     print(f"  • Loaded {len(df)} records")
     print(f"  • Columns: {list(df.columns)}")
 
-    # Convert date column to datetime
+    # Split the date column into leading integer year and month columns
     if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"])
-
-        # Extract year and month
-        df["year"] = df["date"].dt.strftime("%Y")
-        df["month"] = df["date"].dt.strftime("%m")
-
-        # Remove the original date column
-        df = df.drop("date", axis=1)
-
-        # Reorder columns to have year and month first
-        cols = ["year", "month"] + [col for col in df.columns if col not in ["year", "month"]]
-        df = df[cols]
+        df = split_date_column(df)
 
         print("  • Split date into year/month columns")
         print(
-            f"  • Date range: {df['year'].min()}-{df['month'].min()} "
-            f"to {df['year'].max()}-{df['month'].max()}"
+            f"  • Date range: {df['year'].min()}-{df['month'].min():02d} "
+            f"to {df['year'].max()}-{df['month'].max():02d}"
         )
 
     else:
@@ -54,7 +47,7 @@ def process_nvidia_revenue():
 
     # Save processed data
     output_path = processed_dir / "nvidia_revenue_processed.csv"
-    df.to_csv(output_path, index=False)
+    write_processed(df, output_path)
 
     print(f"✓ Processed data saved to {output_path}")
     print(f"  • Final columns: {list(df.columns)}")
@@ -1,7 +1,11 @@
+import sys
 from pathlib import Path
 
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils import split_date_column, write_processed
+
 
 def process_occupation_employment() -> None:
     """Process occupation employment into indexed displacement gap.
@@ -27,39 +31,35 @@ def process_occupation_employment() -> None:
 
     print(f"  • Loaded {len(df)} records")
 
-    # Create indices (first observation = 100)
-    base_ai = df["ai_targetable"].iloc[0]
-    base_non = df["non_automatable"].iloc[0]
+    # Create indices (first observation = 100) on the raw arrays, scaling in
+    # place so each index is a single allocation with no Series alignment
+    ai = df["ai_targetable"].to_numpy()
+    non = df["non_automatable"].to_numpy()
+    ai_index = ai / ai[0]
+    ai_index *= 100
+    non_index = non / non[0]
+    non_index *= 100
 
-    df["ai_targetable_index"] = df["ai_targetable"] / base_ai * 100
-    df["non_automatable_index"] = df["non_automatable"] / base_non * 100
+    df["ai_targetable_index"] = ai_index
+    df["non_automatable_index"] = non_index
 
     # Displacement gap: positive = non-automatable growing faster
-    df["displacement_gap"] = (
-        df["non_automatable_index"] - df["ai_targetable_index"]
-    )
+    df["displacement_gap"] = non_index - ai_index
 
     # Convert date to year/month
-    df["year"] = df["date"].dt.strftime("%Y")
-    df["month"] = df["date"].dt.strftime("%m")
-    df = df.drop("date", axis=1)
-
-    cols = ["year", "month"] + [
-        c for c in df.columns if c not in ["year", "month"]
-    ]
-    df = df[cols]
+    df = split_date_column(df)
 
     output_path = processed_dir / "occupation_employment_processed.csv"
-    df.to_csv(output_path, index=False)
+    write_processed(df, output_path)
 
     print(f"✓ Saved to {output_path}")
     print("\nRecent displacement gaps:")
-    for _, row in df.tail(6).iterrows():
+    for row in df.tail(6).itertuples(index=False):
         print(
-            f"  • {row['year']}-{row['month']}: "
-            f"AI={row['ai_targetable_index']:.1f}, "
-            f"Non-auto={row['non_automatable_index']:.1f}, "
-            f"Gap={row['displacement_gap']:+.1f}"
+            f"  • {row.year}-{row.month:02d}: "
+            f"AI={row.ai_targetable_index:.1f}, "
+            f"Non-auto={row.non_automatable_index:.1f}, "
+            f"Gap={row.displacement_gap:+.1f}"
         )
 
 
@@ -1,19 +1,234 @@
-from io import StringIO
+import json
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, lru_cache
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
-def get_missing_quarters(data_name: str, target_quarters: int = 14) -> list:
+# A canonical FRED output younger than this many hours is treated as current
+FRESH_HOURS = float(os.environ.get("FRED_FRESH_HOURS", "12"))
+
+# Quarter-availability checks only ever need the date column
+DATE_ONLY = pa_csv.ConvertOptions(include_columns=["date"], column_types={"date": pa.date32()})
+
+
+@cache
+def get_session() -> requests.Session:
+    """
+    Return the pooled HTTP session shared by every download.
+
+    Repeated requests to the same host reuse kept-alive connections instead of
+    renegotiating TLS each time, and transient server errors are retried with
+    backoff. The session is built on first use, so modules that only import
+    the CSV helpers never set up networking.
+
+    Returns:
+        The shared requests.Session
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD"],
+            ),
+        ),
+    )
+    return session
+
+
+def read_csv(path, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV with pandas' multithreaded pyarrow parser.
+
+    Args:
+        path: File path or file-like object to read
+        **kwargs: Passed through to pd.read_csv (e.g. usecols, parse_dates)
+
+    Returns:
+        DataFrame with the usual NumPy-backed columns
+    """
+    return pd.read_csv(path, engine="pyarrow", **kwargs)
+
+
+def split_date_column(df: pd.DataFrame, date_col: str = "date") -> pd.DataFrame:
+    """
+    Replace a date column with leading integer year and month columns.
+
+    Args:
+        df: DataFrame with a date column
+        date_col: Name of the date column to split (default: "date")
+
+    Returns:
+        DataFrame with year and month first, followed by the remaining columns
+    """
+    dates = pd.to_datetime(df[date_col]).dt
+    df = df.drop(columns=date_col)
+    df.insert(0, "month", dates.month.astype("int8"))
+    df.insert(0, "year", dates.year.astype("int16"))
+    return df
+
+
+def write_processed(df: pd.DataFrame, output_path: Path) -> None:
+    """
+    Write a processed year/month frame to CSV plus its typed Parquet copy.
+
+    Months are held as integers in memory and only zero-padded in the CSV, so
+    the files keep their "2024,01" layout. The Parquet copy next to it has the
+    shape convert_to_parquet produces (a date column plus float32 metrics,
+    zstd-compressed), so the dashboard can read it without re-parsing the CSV,
+    and the dataset is added to data/processed/manifest.json if it isn't listed.
+
+    Args:
+        df: DataFrame with integer year and month columns
+        output_path: Destination CSV path; the Parquet copy swaps the suffix
+    """
+    df.assign(month=df["month"].map("{:02d}".format)).to_csv(output_path, index=False)
+
+    months_since_epoch = (df["year"].to_numpy(np.int64) - 1970) * 12 + df["month"] - 1
+    date = months_since_epoch.to_numpy().astype("datetime64[M]").astype("datetime64[ns]")
+    columns = {"date": date}
+    columns.update(
+        (name, df[name].to_numpy(np.float32)) for name in df.columns.drop(["year", "month"])
+    )
+    pq.write_table(pa.table(columns), output_path.with_suffix(".parquet"), compression="zstd")
+
+    # Register the dataset in the dashboard's manifest so it shows up without
+    # a separate convert_to_parquet run. A missing manifest is left alone: the
+    # dashboard then checks each dataset's files directly, whereas a partial
+    # manifest would hide every dataset not yet listed.
+    manifest_path = output_path.parent.parent / "manifest.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        if not manifest.get(output_path.parent.name):
+            manifest[output_path.parent.name] = True
+            manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+def process_date_split(data_name: str, label: str):
+    """
+    Process a raw FRED dataset by splitting date into year and month columns
+    and removing the original date column.
+
+    Args:
+        data_name: Name of the dataset (used in directory and file naming)
+        label: Human-readable dataset name for progress messages
+
+    Returns:
+        Processed DataFrame, or None if there was nothing to process
+    """
+    # Setup paths
+    raw_dir = Path(f"data/raw/{data_name}")
+    processed_dir = Path(f"data/processed/{data_name}")
+    processed_dir.mkdir(parents=True, exist_ok=True)
+
+    # Find the dataset's CSV file
+    csv_files = list(raw_dir.glob(f"{data_name}_last_*.csv"))
+
+    if not csv_files:
+        print(f"No {label} CSV files found in raw directory")
+        return
+
+    input_file = csv_files[0]  # Use the first (should be only one)
+    print(f"Processing {input_file.name}...")
+
+    # Load the data as an Arrow table; the split happens there and pandas
+    # only ever sees the finished frame
+    table = pa_csv.read_csv(input_file)
+
+    print(f"  • Loaded {table.num_rows} records")
+    print(f"  • Columns: {table.column_names}")
+
+    # Split the date column into leading integer year and month columns
+    if "date" in table.column_names:
+        dates = table["date"]
+        table = table.drop_columns(["date"])
+        table = table.add_column(0, "month", pc.month(dates).cast(pa.int8()))
+        table = table.add_column(0, "year", pc.year(dates).cast(pa.int16()))
+        df = table.to_pandas()
+
+        print("  • Split date into year/month columns")
+        print(
+            f"  • Date range: {df['year'].min()}-{df['month'].min():02d} "
+            f"to {df['year'].max()}-{df['month'].max():02d}"
+        )
+    else:
+        print("  ⚠ No 'date' column found")
+        return
+
+    # Save processed data
+    output_path = processed_dir / f"{data_name}_processed.csv"
+    write_processed(df, output_path)
+
+    print(f"✓ Processed data saved to {output_path}")
+    print(f"  • Final columns: {list(df.columns)}")
+
+    # Show sample of processed data
+    print("\nSample of processed data:")
+    print(df.head().to_string(index=False))
+
+    return df
+
+
+@lru_cache(maxsize=64)
+def _existing_quarters(quarter_files: tuple) -> frozenset:
+    """
+    Collect the (year, quarter) pairs present in a set of quarterly CSVs.
+
+    Cached on the files' paths and modification times, so repeated checks of
+    an unchanged dataset skip re-parsing it.
+
+    Args:
+        quarter_files: Sorted (path, mtime_ns) pairs for the CSVs to read
+
+    Returns:
+        Frozen set of (year, quarter) tuples found in the files
+    """
+    existing_quarters = set()
+    for file_path, _mtime in quarter_files:
+        # Try to read the file and extract quarters from the data
+        try:
+            # Arrow parses only the date column and derives year/quarter in
+            # C++, without building a DataFrame. Files without a date column
+            # raise and are skipped like any other unreadable file
+            dates = pa_csv.read_csv(file_path, convert_options=DATE_ONLY).column("date")
+            existing_quarters.update(
+                zip(pc.year(dates).to_pylist(), pc.quarter(dates).to_pylist(), strict=True)
+            )
+        except Exception:
+            pass  # Skip files that can't be read
+    return frozenset(existing_quarters)
+
+
+def get_missing_quarters(
+    data_name: str, target_quarters: int = 14, log: Callable[[str], None] = print
+) -> list:
     """
     Identify which quarters in the past N quarters are missing from raw data.
     
     Args:
         data_name: Name for the dataset (used in file naming)
         target_quarters: Number of quarters to check (default: 14)
+        log: Function that receives each progress message (default: print)
     
     Returns:
         List of (year, quarter) tuples that are missing
@@ -33,33 +248,52 @@ def get_missing_quarters(data_name: str, target_quarters: int = 14) -> list:
         quarter_num = (quarter_date.month - 1) // 3 + 1
         past_quarters.append((quarter_date.year, quarter_num))
     
-    # Check existing data to see what quarters we have
-    existing_quarters = set()
-    if data_dir.exists():
-        for file_path in data_dir.glob("*.csv"):
-            if "quarters" in file_path.stem:
-                # Try to read the file and extract quarters from the data
-                try:
-                    df = pd.read_csv(file_path)
-                    if 'date' in df.columns:
-                        df['date'] = pd.to_datetime(df['date'])
-                        for _, row in df.iterrows():
-                            date = row['date']
-                            quarter = (date.month - 1) // 3 + 1
-                            existing_quarters.add((date.year, quarter))
-                except Exception:
-                    pass  # Skip files that can't be read
-    
+    # The canonical output is rewritten on every download. While it is fresh
+    # the data is as current as FRED's release schedule allows, so skip the
+    # check; otherwise it alone decides which quarters we already have.
+    expected = data_dir / f"{data_name}_last_{target_quarters}_quarters.csv"
+    try:
+        expected_mtime_ns = expected.stat().st_mtime_ns
+    except FileNotFoundError:
+        expected_mtime_ns = None
+
+    if expected_mtime_ns is not None:
+        age_hours = (time.time_ns() - expected_mtime_ns) / 3.6e12
+        if age_hours < FRESH_HOURS:
+            log(f"✓ {expected.name} was refreshed {age_hours:.1f}h ago, skipping quarter check")
+            return []
+        quarter_files = [(str(expected), expected_mtime_ns)]
+    else:
+        # Fall back to any quarterly CSV. A single scandir pass lists them
+        # without glob stats; their modification times key the cache, so
+        # unchanged files aren't re-read.
+        try:
+            with os.scandir(data_dir) as entries:
+                quarter_files = sorted(
+                    (entry.path, entry.stat().st_mtime_ns) for entry in entries
+                    if entry.name.endswith(".csv") and "quarters" in entry.name[:-4]
+                )
+        except FileNotFoundError:
+            quarter_files = []
+
+    existing_quarters = _existing_quarters(tuple(quarter_files))
+
     # Find missing quarters from our target list
     missing_quarters = [q for q in past_quarters if q not in existing_quarters]
     
-    print(f"Found data for {len(existing_quarters)} quarters: {sorted(existing_quarters)}")
-    print(f"Missing {len(missing_quarters)} quarters from past {target_quarters}: {sorted(missing_quarters)}")
+    log(f"Found data for {len(existing_quarters)} quarters: {sorted(existing_quarters)}")
+    log(f"Missing {len(missing_quarters)} quarters from past {target_quarters}: {sorted(missing_quarters)}")
     
     return missing_quarters
 
 
-def fetch_fred_data(url: str, data_name: str, column_name: str, quarters: int = 14) -> pd.DataFrame:
+def fetch_fred_data(
+    url: str,
+    data_name: str,
+    column_name: str,
+    quarters: int = 14,
+    log: Callable[[str], None] = print,
+) -> pd.DataFrame:
     """
     Fetch economic data from FRED and save last N quarters to raw directory.
     Only fetches data if we don't already have the past N quarters.
@@ -69,12 +303,14 @@ def fetch_fred_data(url: str, data_name: str, column_name: str, quarters: int =
         data_name: Name for the dataset (used in file naming)
         column_name: Name for the data column
         quarters: Number of recent quarters to save (default: 14)
+        log: Function that receives each progress message (default: print)
 
     Returns:
-        DataFrame with the last N quarters of data
+        DataFrame with the last N quarters of data. Freshly downloaded data is
+        returned as a slice of the full series; copy it before modifying it
     """
     # Check if we need to fetch new data
-    missing_quarters = get_missing_quarters(data_name, quarters)
+    missing_quarters = get_missing_quarters(data_name, quarters, log)
     
     data_dir = Path(f"data/raw/{data_name}")
     data_dir.mkdir(parents=True, exist_ok=True)
@@ -83,49 +319,87 @@ def fetch_fred_data(url: str, data_name: str, column_name: str, quarters: int =
     
     # If we have all the quarters we need, just load existing data
     if not missing_quarters and output_path.exists():
-        print(f"✓ All {quarters} quarters already exist for {data_name}")
-        df_existing = pd.read_csv(output_path)
-        df_existing['date'] = pd.to_datetime(df_existing['date'])
-        print(f"✓ Loaded existing data from {output_path}")
+        log(f"✓ All {quarters} quarters already exist for {data_name}")
+        df_existing = read_csv(output_path, parse_dates=['date'])
+        log(f"✓ Loaded existing data from {output_path}")
         return df_existing
 
-    print(f"Downloading {data_name} data from FRED...")
+    log(f"Downloading {data_name} data from FRED...")
 
     # Download the data
-    response = requests.get(url)
+    response = get_session().get(url, timeout=30)
     response.raise_for_status()
 
-    # Load the data directly from response
-    df = pd.read_csv(StringIO(response.text))
+    # Hand the raw bytes straight to the pyarrow parser, skipping the text decode
+    df = read_csv(BytesIO(response.content), parse_dates=[0], na_values=["."])
 
     # Rename columns for clarity
     df.columns = ["date", column_name]
-    df["date"] = pd.to_datetime(df["date"])
 
     # Drop rows with missing dates or values
     df = df.dropna(subset=["date", column_name])
 
-    # Filter for last N quarters
-    df_recent = df.tail(quarters).copy()
+    # Filter for last N quarters. The slice is only printed, saved and
+    # returned, so it doesn't need its own copy of the data
+    df_recent = df.iloc[-quarters:]
 
-    print("\nData Summary:")
-    print(f"  • Date range: {df['date'].min()} to {df['date'].max()}")
-    print(f"  • Number of observations: {len(df)}")
+    log("\nData Summary:")
+    log(f"  • Date range: {df['date'].min()} to {df['date'].max()}")
+    log(f"  • Number of observations: {len(df)}")
     latest_date = df.iloc[-1]["date"].strftime("%Y-%m-%d")
-    print(f"  • Latest value: {df.iloc[-1][column_name]:.2f} ({latest_date})")
+    log(f"  • Latest value: {df.iloc[-1][column_name]:.2f} ({latest_date})")
 
-    print(f"\nLast {quarters} quarters:")
-    for _, row in df_recent.iterrows():
-        quarter = (row['date'].month - 1) // 3 + 1
-        print(f"  • {row['date'].strftime('%Y')} Q{quarter}: {row[column_name]:.2f}")
+    log(f"\nLast {quarters} quarters:")
+    dates = df_recent["date"].dt
+    labels = dates.year.astype(str) + " Q" + dates.quarter.astype(str)
+    values = df_recent[column_name].map("{:.2f}".format)
+    log("\n".join("  • " + labels + ": " + values))
 
     # Save only the last N quarters to raw directory
     df_recent.to_csv(output_path, index=False)
-    print(f"\n✓ Last {quarters} quarters saved to {output_path}")
+    log(f"\n✓ Last {quarters} quarters saved to {output_path}")
 
     return df_recent
 
 
+def fetch_fred_data_many(specs: list, max_workers: int = 4) -> dict:
+    """
+    Fetch several FRED series concurrently with fetch_fred_data.
+
+    Each series' progress messages are buffered and printed as one block when
+    its download finishes, so concurrent fetches don't interleave their output.
+    A series that fails is reported with its error and left out of the result;
+    the others are still collected.
+
+    Args:
+        specs: (url, data_name, column_name, quarters) tuples, one per series
+        max_workers: Maximum number of concurrent downloads (default: 4)
+
+    Returns:
+        Dict mapping each successfully fetched data_name to its DataFrame
+    """
+
+    def fetch(url: str, data_name: str, column_name: str, quarters: int):
+        messages = []
+        try:
+            df = fetch_fred_data(url, data_name, column_name, quarters, log=messages.append)
+        except Exception as e:
+            messages.append(f"  ⚠ {data_name}: {e}")
+            df = None
+        return data_name, df, messages
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(fetch, *spec) for spec in specs]
+        for future in as_completed(futures):
+            data_name, df, messages = future.result()
+            print("\n".join(messages) + "\n")
+            if df is not None:
+                results[data_name] = df
+
+    return results
+
+
 def analyze_trend(df: pd.DataFrame, column_name: str) -> None:
     """
     Analyze year-over-year trends in the data.